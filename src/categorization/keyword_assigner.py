@@ -19,9 +19,11 @@ from typing import Final
 
 from src.categorization.keyword_assigner_cache import KeywordAssignmentCache
 from src.categorization.keyword_taxonomy import (
+    ALL_KEYWORDS,
     KEYWORD_TAXONOMY_VERSION,
-    get_all_keywords,
-    is_valid_keyword,
+    MULTI_PART_KEYWORDS,
+    find_keyword_parts,
+    find_keywords,
 )
 from src.consts import DEFAULT_DATA_DIR
 from src.models.model_classification import (
@@ -67,11 +69,18 @@ class KeywordAssigner:
             # Use FileCache defaults
             self._cache = KeywordAssignmentCache()
 
-        self._overrides: dict[str, list[str]] = {}
-        self._load_overrides()
+        # Loaded lazily on first use; cache hits never need them
+        self._overrides: dict[str, list[str]] | None = None
 
-    def _load_overrides(self) -> None:
+    def _get_overrides(self) -> dict[str, list[str]]:
+        """Get keyword overrides, loading them from file on first access."""
+        if self._overrides is None:
+            self._overrides = self._load_overrides()
+        return self._overrides
+
+    def _load_overrides(self) -> dict[str, list[str]]:
         """Load keyword overrides from file."""
+        overrides: dict[str, list[str]] = {}
         data_dir = self.data_dir if self.data_dir is not None else DEFAULT_DATA_DIR
         overrides_path = data_dir / "overrides.json"
         if overrides_path.exists():
@@ -79,10 +88,11 @@ class KeywordAssigner:
                 data = json.loads(overrides_path.read_text())
                 keyword_overrides = data.get("keyword_overrides", {})
                 for artifact_id, override_data in keyword_overrides.items():
-                    self._overrides[artifact_id] = override_data.get("keywords", [])
-                logger.info(f"Loaded {len(self._overrides)} keyword overrides")
+                    overrides[artifact_id] = override_data.get("keywords", [])
+                logger.info(f"Loaded {len(overrides)} keyword overrides")
             except Exception as e:
                 logger.warning(f"Failed to load keyword overrides: {e}")
+        return overrides
 
     def _match_keywords(
         self,
@@ -98,17 +108,38 @@ class KeywordAssigner:
             description: Tool description.
 
         Returns:
-            Dict mapping keyword to confidence score (0.0-1.0).
+            Dict mapping keyword to confidence score (0.0-1.0), in alphabetical
+            keyword order.
         """
         keyword_scores: dict[str, float] = {}
-        all_keywords = get_all_keywords()
 
         # Normalize inputs
-        tags_lower = [t.lower() for t in tags]
+        tags_lower = {t.lower() for t in tags}
         name_lower = name.lower()
         desc_lower = description.lower()
 
-        for keyword in all_keywords:
+        # One regex scan per field instead of a substring test per keyword
+        name_hits = find_keywords(name_lower)
+        desc_hits = find_keywords(desc_lower)
+        name_parts = find_keyword_parts(name_lower)
+        desc_parts = find_keyword_parts(desc_lower)
+
+        # Partial matches with word boundaries: all parts appear in name or description
+        partial_name: set[str] = set()
+        partial_desc: set[str] = set()
+        for keyword, keyword_parts in MULTI_PART_KEYWORDS:
+            if keyword_parts <= name_parts:
+                partial_name.add(keyword)
+            elif keyword_parts <= desc_parts:
+                partial_desc.add(keyword)
+
+        candidates = (
+            (tags_lower & ALL_KEYWORDS) | name_hits | desc_hits | partial_name | partial_desc
+        )
+
+        # Candidates are few; sorting them here keeps the dict (and anything
+        # filtered from it) in alphabetical order without a second sort
+        for keyword in sorted(candidates):
             score = 0.0
 
             # Exact tag match (highest priority)
@@ -116,7 +147,7 @@ class KeywordAssigner:
                 score = max(score, 0.9)
 
             # Name contains keyword (high priority)
-            if keyword in name_lower:
+            if keyword in name_hits:
                 # Bonus for exact match
                 if keyword == name_lower:
                     score = max(score, 0.95)
@@ -124,17 +155,13 @@ class KeywordAssigner:
                     score = max(score, 0.8)
 
             # Description contains keyword (moderate priority)
-            if keyword in desc_lower:
+            if keyword in desc_hits:
                 score = max(score, 0.6)
 
-            # Partial matches with word boundaries
-            keyword_parts = keyword.split("-")
-            if len(keyword_parts) > 1:
-                # Check if all parts appear in name or description
-                if all(part in name_lower for part in keyword_parts):
-                    score = max(score, 0.75)
-                elif all(part in desc_lower for part in keyword_parts):
-                    score = max(score, 0.55)
+            if keyword in partial_name:
+                score = max(score, 0.75)
+            elif keyword in partial_desc:
+                score = max(score, 0.55)
 
             if score > MIN_MATCH_SCORE:
                 keyword_scores[keyword] = score
@@ -181,15 +208,40 @@ class KeywordAssigner:
         """
         # Resolve canonical name if not provided
         if canonical_name is None:
-            # Simple extraction from artifact_id
-            parts = artifact_id.split(":")
-            if len(parts) == 2:
-                source, path = parts
-                name_part = path.split("/")[-1]
-                canonical_name = name_part.lower()
+            # Simple extraction from artifact_id ("source:namespace/name")
+            _, sep, path = artifact_id.partition(":")
+            if sep and ":" not in path:
+                canonical_name = path.rpartition("/")[2].lower()
             else:
                 canonical_name = name.lower()
 
+        return self._assign_resolved(artifact_id, canonical_name, name, tags, description, force)
+
+    def _assign_resolved(
+        self,
+        artifact_id: str,
+        canonical_name: str,
+        name: str,
+        tags: list[str],
+        description: str,
+        force: bool,
+    ) -> KeywordAssignmentResult:
+        """Assign keywords once the canonical name is known.
+
+        Shared by assign() and assign_tool(); the latter already carries a
+        resolved canonical name and calls this directly.
+
+        Args:
+            artifact_id: Full artifact ID.
+            canonical_name: Resolved canonical name (cache key).
+            name: Tool name.
+            tags: Tags from the source.
+            description: Tool description.
+            force: If True, bypass cache.
+
+        Returns:
+            KeywordAssignmentResult with keywords and metadata.
+        """
         # 1. Check cache (by canonical name)
         if not force:
             cached = self._cache.get(canonical_name)
@@ -203,8 +255,8 @@ class KeywordAssigner:
                 )
 
         # 2. Check overrides (by artifact ID)
-        if artifact_id in self._overrides:
-            override_keywords = self._overrides[artifact_id]
+        override_keywords = self._get_overrides().get(artifact_id)
+        if override_keywords is not None:
             assignment = KeywordAssignment(keywords=override_keywords)
 
             # Cache the override result
@@ -226,7 +278,7 @@ class KeywordAssigner:
         # 3. Heuristic matching
         keyword_scores = self._match_keywords(tags, name, description)
 
-        # Filter by confidence threshold
+        # Filter by confidence threshold (preserves alphabetical order)
         matched_keywords = [
             kw for kw, score in keyword_scores.items() if score >= KEYWORD_CONFIDENCE_THRESHOLD
         ]
@@ -234,9 +286,6 @@ class KeywordAssigner:
         overall_confidence = self._calculate_overall_confidence(keyword_scores)
 
         if matched_keywords:
-            # Sort keywords alphabetically for consistent output
-            matched_keywords.sort()
-
             assignment = KeywordAssignment(keywords=matched_keywords)
 
             # Cache the result
@@ -287,13 +336,13 @@ class KeywordAssigner:
         Returns:
             KeywordAssignmentResult with keywords and metadata.
         """
-        return self.assign(
-            artifact_id=tool.id,
-            name=tool.name,
-            tags=tool.tags,
-            description=tool.description,
-            canonical_name=tool.identity.canonical_name,
-            force=force,
+        return self._assign_resolved(
+            tool.id,
+            tool.identity.canonical_name,
+            tool.name,
+            tool.tags,
+            tool.description,
+            force,
         )
 
     def apply_keywords(self, tool: "Tool", force: bool = False) -> None:  # noqa: F821
@@ -326,12 +375,12 @@ class KeywordAssigner:
             True if override was added, False if validation failed.
         """
         # Validate keywords
-        invalid = [kw for kw in keywords if not is_valid_keyword(kw)]
+        invalid = set(keywords) - ALL_KEYWORDS
         if invalid:
-            logger.error(f"Invalid keywords: {invalid}")
+            logger.error(f"Invalid keywords: {sorted(invalid)}")
             return False
 
-        self._overrides[artifact_id] = keywords
+        self._get_overrides()[artifact_id] = keywords
         self._save_overrides(reason_map={artifact_id: reason})
 
         # Invalidate any cached assignment
@@ -356,7 +405,7 @@ class KeywordAssigner:
 
         # Build keyword overrides section
         keyword_overrides = {}
-        for artifact_id, keywords in self._overrides.items():
+        for artifact_id, keywords in self._get_overrides().items():
             keyword_overrides[artifact_id] = {
                 "keywords": keywords,
                 "reason": (
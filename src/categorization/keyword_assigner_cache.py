@@ -7,6 +7,8 @@ domain-specific API.
 import logging
 from pathlib import Path
 
+from pydantic import TypeAdapter, ValidationError
+
 from src.models.model_classification import KeywordAssignmentCacheEntry
 from src.storage.cache.file_caching import FileCache
 
@@ -15,6 +17,11 @@ logger = logging.getLogger(__name__)
 # Category name for keyword assignment cache entries
 KEYWORD_ASSIGNMENT_CATEGORY = "keyword_assignments"
 
+# Validates a whole batch of cached entries in a single pydantic-core call
+_ENTRIES_ADAPTER: TypeAdapter[list[KeywordAssignmentCacheEntry]] = TypeAdapter(
+    list[KeywordAssignmentCacheEntry]
+)
+
 
 class KeywordAssignmentCache:
     """Keyword assignment cache keyed by canonical name.
@@ -93,18 +100,51 @@ class KeywordAssignmentCache:
         """
         return self._cache.list_keys(KEYWORD_ASSIGNMENT_CATEGORY)
 
+    def _load_entries(
+        self, source: str | None = None
+    ) -> list[tuple[str, KeywordAssignmentCacheEntry]]:
+        """Load and validate cached entries in one batch.
+
+        Falls back to per-entry validation, skipping invalid entries, if the
+        batch contains anything that fails to parse.
+
+        Args:
+            source: If provided, only entries with this source are validated
+                   and returned; the rest are filtered on the raw data.
+
+        Returns:
+            List of (canonical_name, entry) tuples for all valid entries.
+        """
+        items = self._cache.items(KEYWORD_ASSIGNMENT_CATEGORY)
+        if source is not None:
+            items = [
+                (key, data)
+                for key, data in items
+                if isinstance(data, dict) and data.get("source") == source
+            ]
+        if not items:
+            return []
+
+        keys = [key for key, _ in items]
+        try:
+            entries = _ENTRIES_ADAPTER.validate_python([data for _, data in items])
+            return list(zip(keys, entries, strict=True))
+        except ValidationError:
+            results = []
+            for key, data in items:
+                try:
+                    results.append((key, KeywordAssignmentCacheEntry.model_validate(data)))
+                except Exception as e:
+                    logger.warning(f"Failed to parse cached keyword assignment for {key}: {e}")
+            return results
+
     def get_all_entries(self) -> list[tuple[str, KeywordAssignmentCacheEntry]]:
         """Get all cached keyword assignment entries.
 
         Returns:
             List of (canonical_name, entry) tuples for all cached entries.
         """
-        results = []
-        for key in self._cache.list_keys(KEYWORD_ASSIGNMENT_CATEGORY):
-            entry = self.get(key)
-            if entry:
-                results.append((key, entry))
-        return results
+        return self._load_entries()
 
     def get_entries_by_source(self, source: str) -> list[tuple[str, KeywordAssignmentCacheEntry]]:
         """Get all cached entries with a specific source.
@@ -115,12 +155,7 @@ class KeywordAssignmentCache:
         Returns:
             List of (canonical_name, entry) tuples matching the source.
         """
-        results = []
-        for key in self._cache.list_keys(KEYWORD_ASSIGNMENT_CATEGORY):
-            entry = self.get(key)
-            if entry and entry.source == source:
-                results.append((key, entry))
-        return results
+        return self._load_entries(source)
 
 
 def main() -> None:
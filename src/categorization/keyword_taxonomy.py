@@ -6,6 +6,8 @@ Keywords are metadata only - not scored, just displayed/exported for
 search and filtering.
 """
 
+import re
+from collections.abc import Iterable, Mapping
 from typing import Final
 
 # Keyword taxonomy version for cache invalidation
@@ -219,17 +221,113 @@ KEYWORD_CATEGORIES: Final[dict[str, tuple[str, ...]]] = {
 }
 
 
+def _compile_terms(terms: Iterable[str]) -> tuple[re.Pattern[str], dict[str, tuple[str, ...]]]:
+    """Compile terms into a single substring-matching pattern.
+
+    The alternation is ordered longest-first and wrapped in a lookahead, so one
+    scan reports the longest term starting at every position. Any shorter term
+    starting at the same position is a prefix of that match, so the returned
+    prefix map recovers every term occurring in the text.
+
+    Args:
+        terms: Terms to match as plain substrings.
+
+    Returns:
+        Tuple of (compiled pattern, mapping of term to the terms it starts with).
+    """
+    ordered = sorted(set(terms), key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(term) for term in ordered) + "))")
+    prefixes = {term: tuple(p for p in ordered if term.startswith(p)) for term in ordered}
+    return pattern, prefixes
+
+
+def _find_terms(
+    text: str, pattern: re.Pattern[str], prefixes: dict[str, tuple[str, ...]]
+) -> set[str]:
+    """Find every term of a compiled matcher occurring in text."""
+    found: set[str] = set()
+    for longest in set(pattern.findall(text)):
+        found.update(prefixes[longest])
+    return found
+
+
+def _index_keywords(categories: Mapping[str, Iterable[str]]) -> dict[str, str]:
+    """Map each keyword to the first category that lists it.
+
+    Args:
+        categories: Mapping of category name to its keywords.
+
+    Returns:
+        Dict of keyword to owning category; on duplicates the first one wins.
+    """
+    index: dict[str, str] = {}
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            index.setdefault(keyword, category)
+    return index
+
+
+# Derived views of the (immutable) taxonomy, computed once at import
+_ALL_CATEGORIES_LIST: Final[list[str]] = list(KEYWORD_CATEGORIES)
+_ALL_KEYWORDS_LIST: Final[list[str]] = [
+    keyword for keywords in KEYWORD_CATEGORIES.values() for keyword in keywords
+]
+_KEYWORDS_BY_CATEGORY: Final[dict[str, list[str]]] = {
+    category: list(keywords) for category, keywords in KEYWORD_CATEGORIES.items()
+}
+
+# Set of every valid keyword, for O(1) membership and subset checks
+ALL_KEYWORDS: Final[frozenset[str]] = frozenset(_ALL_KEYWORDS_LIST)
+
+# Reverse index: keyword -> owning category
+_KEYWORD_TO_CATEGORY: Final[dict[str, str]] = _index_keywords(KEYWORD_CATEGORIES)
+
+# Hyphenated keywords with their component parts, for partial matching
+MULTI_PART_KEYWORDS: Final[tuple[tuple[str, frozenset[str]], ...]] = tuple(
+    (keyword, frozenset(keyword.split("-")))
+    for keywords in KEYWORD_CATEGORIES.values()
+    for keyword in keywords
+    if "-" in keyword
+)
+
+_KEYWORD_PATTERN, _KEYWORD_PREFIXES = _compile_terms(ALL_KEYWORDS)
+_PART_PATTERN, _PART_PREFIXES = _compile_terms(
+    part for _, parts in MULTI_PART_KEYWORDS for part in parts
+)
+
+
+def find_keywords(text: str) -> set[str]:
+    """Find all keywords occurring as substrings of text in a single scan.
+
+    Args:
+        text: Lowercased text to search (e.g., a tool name or description).
+
+    Returns:
+        Set of keywords contained in the text.
+    """
+    return _find_terms(text, _KEYWORD_PATTERN, _KEYWORD_PREFIXES)
+
+
+def find_keyword_parts(text: str) -> set[str]:
+    """Find all hyphenated-keyword parts occurring as substrings of text.
+
+    Args:
+        text: Lowercased text to search.
+
+    Returns:
+        Set of keyword parts (see MULTI_PART_KEYWORDS) contained in the text.
+    """
+    return _find_terms(text, _PART_PATTERN, _PART_PREFIXES)
+
+
 def get_all_keywords() -> list[str]:
     """Get list of all keywords across all categories."""
-    all_keywords = []
-    for keywords in KEYWORD_CATEGORIES.values():
-        all_keywords.extend(keywords)
-    return all_keywords
+    return _ALL_KEYWORDS_LIST.copy()
 
 
 def get_all_categories() -> list[str]:
     """Get list of all keyword category names."""
-    return list(KEYWORD_CATEGORIES.keys())
+    return _ALL_CATEGORIES_LIST.copy()
 
 
 def get_keywords_by_category(category: str) -> list[str]:
@@ -241,7 +339,8 @@ def get_keywords_by_category(category: str) -> list[str]:
     Returns:
         List of keywords in the category, or empty list if category not found.
     """
-    return list(KEYWORD_CATEGORIES.get(category, ()))
+    keywords = _KEYWORDS_BY_CATEGORY.get(category)
+    return keywords.copy() if keywords is not None else []
 
 
 def is_valid_keyword(keyword: str) -> bool:
@@ -253,8 +352,7 @@ def is_valid_keyword(keyword: str) -> bool:
     Returns:
         True if the keyword exists in any category, False otherwise.
     """
-    all_keywords = get_all_keywords()
-    return keyword in all_keywords
+    return keyword in ALL_KEYWORDS
 
 
 def is_valid_category(category: str) -> bool:
@@ -278,10 +376,7 @@ def get_keyword_category(keyword: str) -> str | None:
     Returns:
         The category name containing the keyword, or None if not found.
     """
-    for category, keywords in KEYWORD_CATEGORIES.items():
-        if keyword in keywords:
-            return category
-    return None
+    return _KEYWORD_TO_CATEGORY.get(keyword)
 
 
 def main() -> None:
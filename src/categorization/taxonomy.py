@@ -8,18 +8,22 @@ select from this predefined list.
 from src.categorization.human_maintained import TAXONOMY
 from src.models.model_classification import Category
 
+# TAXONOMY is an immutable tuple of frozen dataclasses, so the lookups below
+# are built once at import time instead of scanning it on every call
+_CATEGORIES_BY_NAME: dict[str, Category] = {cat.name: cat for cat in TAXONOMY}
+_SUBCATEGORY_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (cat.name, sub.name) for cat in TAXONOMY for sub in cat.subcategories
+)
+
 
 def get_category(name: str) -> Category | None:
     """Get category by name."""
-    for cat in TAXONOMY:
-        if cat.name == name:
-            return cat
-    return None
+    return _CATEGORIES_BY_NAME.get(name)
 
 
 def get_all_categories() -> list[str]:
     """Get list of all category names."""
-    return [cat.name for cat in TAXONOMY]
+    return list(_CATEGORIES_BY_NAME)
 
 
 def get_all_subcategories(category_name: str) -> list[str]:
@@ -32,15 +36,12 @@ def get_all_subcategories(category_name: str) -> list[str]:
 
 def is_valid_category(category: str) -> bool:
     """Check if category name is valid."""
-    return get_category(category) is not None
+    return category in _CATEGORIES_BY_NAME
 
 
 def is_valid_subcategory(category: str, subcategory: str) -> bool:
     """Check if category/subcategory pair is valid."""
-    cat = get_category(category)
-    if cat is None:
-        return False
-    return cat.has_subcategory(subcategory)
+    return (category, subcategory) in _SUBCATEGORY_PAIRS
 
 
 def validate_classification(
@@ -59,11 +60,11 @@ def validate_classification(
         Tuple of (is_valid, error_message). error_message is empty if valid.
     """
     # Validate primary category
-    if not is_valid_category(primary_category):
+    if primary_category not in _CATEGORIES_BY_NAME:
         return False, f"Invalid category: {primary_category}"
 
     # Validate primary subcategory
-    if not is_valid_subcategory(primary_category, primary_subcategory):
+    if (primary_category, primary_subcategory) not in _SUBCATEGORY_PAIRS:
         valid_subs = get_all_subcategories(primary_category)
         return (
             False,
@@ -73,13 +74,10 @@ def validate_classification(
     # Validate secondary categories
     if secondary_categories:
         for sec in secondary_categories:
-            if "/" not in sec:
+            sec_cat, sep, sec_sub = sec.partition("/")
+            if not sep:
                 return False, f"Secondary category must be 'category/subcategory' format: {sec}"
-            parts = sec.split("/", 1)
-            if len(parts) != 2:
-                return False, f"Invalid secondary category format: {sec}"
-            sec_cat, sec_sub = parts
-            if not is_valid_subcategory(sec_cat, sec_sub):
+            if (sec_cat, sec_sub) not in _SUBCATEGORY_PAIRS:
                 return False, f"Invalid secondary category: {sec}"
 
     return True, ""
@@ -103,6 +103,7 @@ TRIVY_DEFAULT_TAG = "latest"
 TRIVY_STALENESS_DAYS = 7  # Re-scan after 7 days
 TRIVY_CONCURRENCY = 1  # Max concurrent scans (set to 1 to avoid cache lock conflicts)
 TRIVY_FAILED_SCAN_TTL = 3600  # 1 hour cache for failed scans
+TRIVY_SAVE_BATCH_SIZE = 10  # Successful scans buffered per incremental save of tools.json
 TRIVY_DB_WARMUP = True  # Pre-download vulnerability DB before scanning to avoid timeouts
 TRIVY_DB_WARMUP_TIMEOUT = 600  # Timeout for DB warmup (10 minutes)
 TRIVY_SKIP_DB_UPDATE_AFTER_WARMUP = True  # Skip DB updates after warmup to avoid cache locks
@@ -123,9 +124,9 @@ UNSCANNABLE_CACHE_TTL = 604800  # 7 days - cache for permanently unscannable ima
 DOCKER_DIGEST_STALENESS_DAYS = 30  # Refetch digest after 30 days
 
 # Images that cannot be scanned (special/reserved images)
-TRIVY_UNSCANNABLE_IMAGES = [
+TRIVY_UNSCANNABLE_IMAGES = frozenset({
     "docker_hub:library/scratch",  # Virtual base image, cannot be pulled
-]
+})
 
 # Digest fetch status codes
 DIGEST_FETCH_SUCCESS = "success"
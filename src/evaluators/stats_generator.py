@@ -6,8 +6,10 @@ and passed to evaluators via EvalContext.
 """
 
 import logging
-import math
 from collections import defaultdict
+from collections.abc import Sequence
+
+import numpy as np
 
 from src.models.model_stats import CategoryStats, DistributionStats, GlobalStats
 from src.models.model_tool import Tool
@@ -15,11 +17,30 @@ from src.models.model_tool import Tool
 logger = logging.getLogger(__name__)
 
 
-def _compute_distribution_stats(values: list[int]) -> DistributionStats:
+# Distribution reported for an empty catalog. DistributionStats is frozen, so
+# the one instance is shared by every sentinel GlobalStats
+_SENTINEL_DISTRIBUTION = DistributionStats(
+    min=0,
+    max=0,
+    median=0,
+    p25=0,
+    p75=0,
+    log_mean=0.0,
+    log_std=1.0,
+)
+
+
+def _compute_distribution_stats(
+    values: Sequence[int] | np.ndarray,
+    *,
+    log_values: np.ndarray | None = None,
+) -> DistributionStats:
     """Compute distribution statistics for a list of values.
 
     Args:
-        values: List of raw metric values (downloads or stars)
+        values: Raw metric values (downloads or stars), as a list or 1-D array
+        log_values: Optional log1p of the same values, in any order. Callers
+            that already hold it skip recomputing the log transform.
 
     Returns:
         DistributionStats with percentiles and log-transformed mean/std
@@ -27,27 +48,30 @@ def _compute_distribution_stats(values: list[int]) -> DistributionStats:
     Raises:
         ValueError: If values list is empty
     """
-    if not values:
+    if len(values) == 0:
         raise ValueError("Cannot compute stats from empty values list")
 
-    # Sort for percentile calculations
-    sorted_values = sorted(values)
+    # Sort for percentile calculations (one C-level sort instead of sorted())
+    sorted_values = np.sort(np.asarray(values, dtype=np.int64))
     n = len(sorted_values)
 
-    # Raw percentiles
-    min_val = sorted_values[0]
-    max_val = sorted_values[-1]
-    median = sorted_values[n // 2] if n % 2 == 1 else (sorted_values[n // 2 - 1] + sorted_values[n // 2]) / 2
-    p25 = sorted_values[n // 4]
-    p75 = sorted_values[(3 * n) // 4]
+    # Raw percentiles, picked by index so they stay nearest-rank, not interpolated
+    min_val = int(sorted_values[0])
+    max_val = int(sorted_values[-1])
+    if n % 2 == 1:
+        median = float(sorted_values[n // 2])
+    else:
+        median = (float(sorted_values[n // 2 - 1]) + float(sorted_values[n // 2])) / 2
+    p25 = float(sorted_values[n // 4])
+    p75 = float(sorted_values[(3 * n) // 4])
 
     # Log-transform: log(value + 1) to handle zeros
-    log_values = [math.log(v + 1) for v in values]
+    if log_values is None:
+        log_values = np.log1p(sorted_values)
 
-    # Compute mean and std of log-transformed values
-    log_mean = sum(log_values) / len(log_values)
-    variance = sum((x - log_mean) ** 2 for x in log_values) / len(log_values)
-    log_std = math.sqrt(variance)
+    # Population mean and std of log-transformed values
+    log_mean = float(log_values.mean())
+    log_std = float(log_values.std())
 
     return DistributionStats(
         min=min_val,
@@ -60,106 +84,149 @@ def _compute_distribution_stats(values: list[int]) -> DistributionStats:
     )
 
 
-def compute_global_stats(tools: list[Tool]) -> GlobalStats:
-    """Compute global statistics across all tools.
+def _extract_metrics(tools: list[Tool]) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Collect (downloads, stars) rows and per-category row indices in one pass.
 
     Args:
         tools: List of all tools in the catalog
 
     Returns:
-        GlobalStats with download and star distributions.
-        Returns sentinel values if tools list is empty.
+        Tuple of (an (n, 2) int64 array of rows, row indices keyed by
+        'category/subcategory'). Uncategorized tools only appear in the rows.
     """
-    if not tools:
-        logger.warning("Empty tools list - returning sentinel global stats")
-        return GlobalStats(
-            total_tools=0,
-            downloads=DistributionStats(
-                min=0,
-                max=0,
-                median=0,
-                p25=0,
-                p75=0,
-                log_mean=0.0,
-                log_std=1.0,
-            ),
-            stars=DistributionStats(
-                min=0,
-                max=0,
-                median=0,
-                p25=0,
-                p75=0,
-                log_mean=0.0,
-                log_std=1.0,
-            ),
-        )
+    # Flat [downloads, stars, downloads, stars, ...] so np.fromiter can copy it
+    # straight into an array of known size, with no per-row tuples
+    flat_metrics: list[int] = []
+    category_rows: dict[str, list[int]] = defaultdict(list)
 
-    # Extract all downloads and stars
-    downloads = [tool.metrics.downloads for tool in tools]
-    stars = [tool.metrics.stars for tool in tools]
+    for i, tool in enumerate(tools):
+        m = tool.metrics
+        flat_metrics.append(m.downloads)
+        flat_metrics.append(m.stars)
 
-    # Compute distribution stats
-    downloads_stats = _compute_distribution_stats(downloads)
-    stars_stats = _compute_distribution_stats(stars)
+        # Skip tools without categorization
+        if not tool.primary_category or not tool.primary_subcategory:
+            continue
 
-    return GlobalStats(
-        total_tools=len(tools),
-        downloads=downloads_stats,
-        stars=stars_stats,
+        category_rows[f"{tool.primary_category}/{tool.primary_subcategory}"].append(i)
+
+    return (
+        np.fromiter(flat_metrics, dtype=np.int64, count=len(flat_metrics)).reshape(-1, 2),
+        {
+            key: np.fromiter(indices, dtype=np.intp, count=len(indices))
+            for key, indices in category_rows.items()
+        },
     )
 
 
-def compute_category_stats(tools: list[Tool]) -> dict[str, CategoryStats]:
-    """Compute category-level statistics for each category/subcategory.
+def _empty_global_stats() -> GlobalStats:
+    """Build the sentinel global statistics used for an empty catalog.
+
+    Returns:
+        GlobalStats with zero counts and log_std=1.0, so that Z-scores
+        computed against it stay finite.
+    """
+    logger.warning("Empty tools list - returning sentinel global stats")
+    return GlobalStats(
+        total_tools=0,
+        downloads=_SENTINEL_DISTRIBUTION,
+        stars=_SENTINEL_DISTRIBUTION,
+    )
 
-    Categories with fewer than 10 tools are still computed but should be
-    flagged for fallback to global stats by evaluators.
+
+def _global_stats_from_metrics(metrics: np.ndarray, log_metrics: np.ndarray) -> GlobalStats:
+    """Build global statistics from extracted (downloads, stars) rows.
 
     Args:
-        tools: List of all tools in the catalog
+        metrics: Non-empty (n, 2) array of (downloads, stars) rows, one per tool
+        log_metrics: np.log1p(metrics)
 
     Returns:
-        Dictionary mapping 'category/subcategory' to CategoryStats
+        GlobalStats with download and star distributions
     """
-    if not tools:
-        return {}
+    return GlobalStats(
+        total_tools=len(metrics),
+        downloads=_compute_distribution_stats(metrics[:, 0], log_values=log_metrics[:, 0]),
+        stars=_compute_distribution_stats(metrics[:, 1], log_values=log_metrics[:, 1]),
+    )
 
-    # Group tools by category/subcategory
-    category_groups: dict[str, list[Tool]] = defaultdict(list)
 
-    for tool in tools:
-        # Skip tools without categorization
-        if not tool.primary_category or not tool.primary_subcategory:
-            continue
+def _category_stats_from_metrics(
+    metrics: np.ndarray,
+    log_metrics: np.ndarray,
+    category_rows: dict[str, np.ndarray],
+) -> dict[str, CategoryStats]:
+    """Build category statistics from extracted rows and per-category indices.
 
-        category_key = f"{tool.primary_category}/{tool.primary_subcategory}"
-        category_groups[category_key].append(tool)
+    Args:
+        metrics: (n, 2) array of (downloads, stars) rows, one per tool
+        log_metrics: np.log1p(metrics), sliced per category instead of recomputed
+        category_rows: 'category/subcategory' to indices into metrics
 
-    # Compute stats for each category
+    Returns:
+        Dictionary mapping 'category/subcategory' to CategoryStats
+    """
     category_stats = {}
 
-    for category_key, category_tools in category_groups.items():
-        # Extract downloads and stars
-        downloads = [tool.metrics.downloads for tool in category_tools]
-        stars = [tool.metrics.stars for tool in category_tools]
+    for category_key, indices in category_rows.items():
+        category_metrics = metrics[indices]
+        category_logs = log_metrics[indices]
 
         # Compute distribution stats (even for small categories)
-        downloads_stats = _compute_distribution_stats(downloads)
-        stars_stats = _compute_distribution_stats(stars)
-
         category_stats[category_key] = CategoryStats(
-            sample_size=len(category_tools),
-            downloads=downloads_stats,
-            stars=stars_stats,
+            sample_size=len(indices),
+            downloads=_compute_distribution_stats(
+                category_metrics[:, 0], log_values=category_logs[:, 0]
+            ),
+            stars=_compute_distribution_stats(
+                category_metrics[:, 1], log_values=category_logs[:, 1]
+            ),
         )
 
     return category_stats
 
 
+def compute_global_stats(tools: list[Tool]) -> GlobalStats:
+    """Compute global statistics across all tools.
+
+    Args:
+        tools: List of all tools in the catalog
+
+    Returns:
+        GlobalStats with download and star distributions.
+        Returns sentinel values if tools list is empty.
+    """
+    if not tools:
+        return _empty_global_stats()
+
+    metrics, _ = _extract_metrics(tools)
+    return _global_stats_from_metrics(metrics, np.log1p(metrics))
+
+
+def compute_category_stats(tools: list[Tool]) -> dict[str, CategoryStats]:
+    """Compute category-level statistics for each category/subcategory.
+
+    Categories with fewer than 10 tools are still computed but should be
+    flagged for fallback to global stats by evaluators.
+
+    Args:
+        tools: List of all tools in the catalog
+
+    Returns:
+        Dictionary mapping 'category/subcategory' to CategoryStats
+    """
+    if not tools:
+        return {}
+
+    metrics, category_rows = _extract_metrics(tools)
+    return _category_stats_from_metrics(metrics, np.log1p(metrics), category_rows)
+
+
 def generate_all_stats(tools: list[Tool]) -> tuple[GlobalStats, dict[str, CategoryStats]]:
     """Generate both global and category statistics.
 
-    Convenience function to compute all statistics in one call.
+    Convenience function to compute all statistics in one call. Metrics are
+    extracted and log-transformed once and shared by both computations.
 
     Args:
         tools: List of all tools in the catalog
@@ -168,8 +235,13 @@ def generate_all_stats(tools: list[Tool]) -> tuple[GlobalStats, dict[str, Catego
         Tuple of (GlobalStats, category_stats_dict).
         Returns sentinel values if tools list is empty.
     """
-    global_stats = compute_global_stats(tools)
-    category_stats = compute_category_stats(tools)
+    if not tools:
+        return _empty_global_stats(), {}
+
+    metrics, category_rows = _extract_metrics(tools)
+    log_metrics = np.log1p(metrics)
+    global_stats = _global_stats_from_metrics(metrics, log_metrics)
+    category_stats = _category_stats_from_metrics(metrics, log_metrics, category_rows)
     return global_stats, category_stats
 
 
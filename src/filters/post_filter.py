@@ -5,7 +5,7 @@ quality scores, lifecycle stage, and policy thresholds.
 """
 
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from src.models.model_eval import FilterThresholds
 from src.models.model_tool import FilterReasons, FilterState, Lifecycle, Tool
@@ -31,25 +31,35 @@ class PostFilter:
             List of tools that should be visible (includes HIDDEN tools)
         """
         filtered = []
-        excluded_count = 0
         hidden_count = 0
 
-        for tool in tools:
-            # Skip already excluded tools from pre-filter
-            if tool.filter_status.state == FilterState.EXCLUDED:
-                excluded_count += 1
-                continue
+        # Partition out tools already excluded by the pre-filter up front
+        pending = [tool for tool in tools if tool.filter_status.state != FilterState.EXCLUDED]
+        excluded_count = len(tools) - len(pending)
+
+        # Read the clock once so every tool is judged against the same instant
+        now = datetime.now(UTC)
+        stale_cutoff = self._stale_cutoff(thresholds, now)
+        # Derived score bounds are properties; read them once, not per tool
+        very_low_score = thresholds.very_low_score
+        low_score_ceiling = thresholds.low_score_ceiling
+
+        for tool in pending:
+            verdict = self._evaluate(
+                tool, thresholds, stale_cutoff, very_low_score, low_score_ceiling
+            )
+            if verdict is not None:
+                state, reason = verdict
+                tool.filter_status.state = state
+                self._add_filter_reason(tool, reason)
+
+                if state == FilterState.EXCLUDED:
+                    excluded_count += 1
+                    logger.debug(
+                        f"Post-filter excluded {tool.id}: {tool.filter_status.reasons}"
+                    )
+                    continue
 
-            # Check exclusion conditions
-            if self._should_exclude_post(tool, thresholds):
-                excluded_count += 1
-                logger.debug(
-                    f"Post-filter excluded {tool.id}: {tool.filter_status.reasons}"
-                )
-                continue
-
-            # Check hidden conditions
-            if self._should_hide(tool, thresholds):
                 hidden_count += 1
                 logger.debug(
                     f"Post-filter hid {tool.id}: {tool.filter_status.reasons}"
@@ -64,79 +74,88 @@ class PostFilter:
 
         return filtered
 
-    def _should_exclude_post(self, tool: Tool, thresholds: FilterThresholds) -> bool:
-        """Check if tool should be excluded in post-filtering.
+    def _evaluate(
+        self,
+        tool: Tool,
+        thresholds: FilterThresholds,
+        stale_cutoff: datetime,
+        very_low_score: float,
+        low_score_ceiling: float,
+    ) -> tuple[FilterState, str] | None:
+        """Decide whether a tool should be excluded or hidden.
+
+        Exclusion checks run before hidden checks and the first match wins.
+        Each tool field involved is read once.
 
         Args:
             tool: Tool to check
             thresholds: Filtering thresholds
+            stale_cutoff: Tools last updated at or before this are stale
+            very_low_score: Score below which a tool is excluded
+            low_score_ceiling: Score below which a tool at or above
+                min_score is hidden
 
         Returns:
-            True if tool should be excluded
+            (state, reason) for the first matching check, or None if the
+            tool should stay as it is
         """
         # Critical vulnerabilities already handled by SecurityEvaluator in registry
         # which sets FilterState.EXCLUDED directly
+        metrics = tool.metrics
+        last_updated = tool.maintenance.last_updated
+        quality_score = tool.quality_score
+        lifecycle = tool.lifecycle
+
+        # Exclusion check 1: Staleness
+        if last_updated is not None and last_updated <= stale_cutoff:
+            return FilterState.EXCLUDED, FilterReasons.STALE
+
+        # Exclusion check 2: Low downloads
+        if metrics.downloads < thresholds.min_downloads:
+            return FilterState.EXCLUDED, FilterReasons.LOW_DOWNLOADS
+
+        # Exclusion check 3: Low stars
+        if metrics.stars < thresholds.min_stars:
+            return FilterState.EXCLUDED, FilterReasons.LOW_DOWNLOADS
+
+        # Exclusion check 4: Very low score (below half of minimum acceptable)
+        if quality_score is not None and quality_score < very_low_score:
+            return FilterState.EXCLUDED, FilterReasons.LOW_SCORE
+
+        # Hidden check 1: Experimental lifecycle
+        if lifecycle == Lifecycle.EXPERIMENTAL:
+            return FilterState.HIDDEN, FilterReasons.EXPERIMENTAL
 
-        # Check 1: Staleness
-        days_since_update = self._calculate_days_since_update(tool)
-        if days_since_update is not None and days_since_update > thresholds.max_days_since_update:
-            tool.filter_status.state = FilterState.EXCLUDED
-            self._add_filter_reason(tool, FilterReasons.STALE)
-            return True
-
-        # Check 2: Low downloads
-        if tool.metrics.downloads < thresholds.min_downloads:
-            tool.filter_status.state = FilterState.EXCLUDED
-            self._add_filter_reason(tool, FilterReasons.LOW_DOWNLOADS)
-            return True
-
-        # Check 3: Low stars
-        if tool.metrics.stars < thresholds.min_stars:
-            tool.filter_status.state = FilterState.EXCLUDED
-            self._add_filter_reason(tool, FilterReasons.LOW_DOWNLOADS)
-            return True
-
-        # Check 4: Very low score (below half of minimum acceptable)
-        if tool.quality_score is not None:
-            very_low_threshold = thresholds.min_score * 0.5
-            if tool.quality_score < very_low_threshold:
-                tool.filter_status.state = FilterState.EXCLUDED
-                self._add_filter_reason(tool, FilterReasons.LOW_SCORE)
-                return True
-
-        return False
-
-    def _should_hide(self, tool: Tool, thresholds: FilterThresholds) -> bool:
-        """Check if tool should be hidden (but not excluded).
+        # Hidden check 2: Legacy lifecycle
+        if lifecycle == Lifecycle.LEGACY:
+            return FilterState.HIDDEN, FilterReasons.LEGACY
+
+        # Hidden check 3: Low score (but not very low)
+        if quality_score is not None and thresholds.min_score <= quality_score < low_score_ceiling:
+            return FilterState.HIDDEN, FilterReasons.LOW_SCORE
+
+        return None
+
+    def _stale_cutoff(
+        self, thresholds: FilterThresholds, current_time: datetime | None = None
+    ) -> datetime:
+        """Calculate the last-update time at or before which a tool is stale.
+
+        Equivalent to _calculate_days_since_update() exceeding
+        max_days_since_update, since whole days are counted, but lets the
+        per-tool check be a single datetime comparison.
 
         Args:
-            tool: Tool to check
             thresholds: Filtering thresholds
+            current_time: Current time (defaults to now)
 
         Returns:
-            True if tool should be hidden
+            Staleness cutoff timestamp
         """
-        # Check 1: Experimental lifecycle
-        if tool.lifecycle == Lifecycle.EXPERIMENTAL:
-            tool.filter_status.state = FilterState.HIDDEN
-            self._add_filter_reason(tool, FilterReasons.EXPERIMENTAL)
-            return True
-
-        # Check 2: Legacy lifecycle
-        if tool.lifecycle == Lifecycle.LEGACY:
-            tool.filter_status.state = FilterState.HIDDEN
-            self._add_filter_reason(tool, FilterReasons.LEGACY)
-            return True
-
-        # Check 3: Low score (but not very low)
-        if tool.quality_score is not None:
-            low_threshold = thresholds.min_score * 1.5
-            if thresholds.min_score <= tool.quality_score < low_threshold:
-                tool.filter_status.state = FilterState.HIDDEN
-                self._add_filter_reason(tool, FilterReasons.LOW_SCORE)
-                return True
-
-        return False
+        if current_time is None:
+            current_time = datetime.now(UTC)
+
+        return current_time - timedelta(days=thresholds.max_days_since_update + 1)
 
     def _calculate_days_since_update(
         self, tool: Tool, current_time: datetime | None = None
@@ -201,8 +220,8 @@ def main() -> None:
     print(f"Min stars: {thresholds.min_stars}")
     print(f"Max days since update: {thresholds.max_days_since_update}")
     print(f"Min score: {thresholds.min_score}")
-    print(f"Low score threshold: {thresholds.min_score * 1.5}")
-    print(f"Very low score threshold: {thresholds.min_score * 0.5}")
+    print(f"Low score threshold: {thresholds.low_score_ceiling}")
+    print(f"Very low score threshold: {thresholds.very_low_score}")
 
     now = datetime.now(timezone.utc)
 
@@ -6,6 +6,7 @@ polluting category distributions and Z-score normalization.
 
 import logging
 import re
+from typing import ClassVar
 
 from src.models.model_tool import FilterReasons, FilterState, Tool
 
@@ -19,23 +20,24 @@ class PreFilter:
     before they can affect category distributions and normalization.
     """
 
-    # Spam patterns for name/description matching
-    SPAM_PATTERNS = [
-        r"\btest\b",
-        r"\bdemo\b",
-        r"\bexample\b",
-        r"\bplaceholder\b",
-        r"\bsample\b",
-        r"\btodo\b",
-        r"\bwip\b",
-        r"^test-",
-        r"^demo-",
-        r"^example-",
+    # Spam keywords, matched case-insensitively as whole words in name/description.
+    # Prefix forms such as "test-foo" are covered too, since "-" ends a word.
+    SPAM_KEYWORDS = [
+        "test",
+        "demo",
+        "example",
+        "placeholder",
+        "sample",
+        "todo",
+        "wip",
     ]
 
-    def __init__(self) -> None:
-        """Initialize pre-filter with compiled regex patterns."""
-        self.spam_regex = re.compile("|".join(self.SPAM_PATTERNS), re.IGNORECASE)
+    # Compiled once per process rather than per instance. One word-boundary
+    # group instead of one alternative per keyword, so the engine checks each
+    # boundary once and then tries the keywords
+    SPAM_REGEX: ClassVar[re.Pattern[str]] = re.compile(
+        r"\b(?:" + "|".join(SPAM_KEYWORDS) + r")\b", re.IGNORECASE
+    )
 
     def apply(self, tools: list[Tool]) -> list[Tool]:
         """Filter out obvious junk before stats computation.
@@ -151,11 +153,11 @@ class PreFilter:
             True if spam patterns detected
         """
         # Check name
-        if self.spam_regex.search(tool.name):
+        if self.SPAM_REGEX.search(tool.name):
             return True
 
         # Check description
-        if tool.description and self.spam_regex.search(tool.description):
+        if tool.description and self.SPAM_REGEX.search(tool.description):
             return True
 
         return False
@@ -1,6 +1,6 @@
 """Evaluation context models for scoring tools."""
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ScoreWeights(BaseModel):
@@ -25,7 +25,12 @@ class ScoreWeights(BaseModel):
 
 
 class FilterThresholds(BaseModel):
-    """Configurable filtering thresholds for tool visibility."""
+    """Configurable filtering thresholds for tool visibility.
+
+    Frozen so a single instance can be shared across filter runs.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     min_downloads: int = Field(default=1000, ge=0, description="Minimum download count")
     min_stars: int = Field(default=100, ge=0, description="Minimum star count")
@@ -35,3 +40,13 @@ class FilterThresholds(BaseModel):
     min_score: float = Field(
         default=30.0, ge=0.0, le=100.0, description="Minimum quality score to be visible"
     )
+
+    @property
+    def very_low_score(self) -> float:
+        """Score below which a tool is excluded outright (half of min_score)."""
+        return self.min_score * 0.5
+
+    @property
+    def low_score_ceiling(self) -> float:
+        """Score below which a tool at or above min_score is hidden (1.5x min_score)."""
+        return self.min_score * 1.5
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.models.common import _utc_now
 from src.models.model_eval import FilterThresholds, ScoreWeights
@@ -11,9 +11,12 @@ from src.models.model_eval import FilterThresholds, ScoreWeights
 class DistributionStats(BaseModel):
     """Statistics for a single metric within a category.
 
-    Used for Z-score normalization of popularity metrics.
+    Used for Z-score normalization of popularity metrics. Frozen, so a
+    single instance can be shared, e.g. the empty-catalog sentinel.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     min: int = Field(ge=0, description="Minimum value")
     max: int = Field(ge=0, description="Maximum value")
     median: float = Field(ge=0.0, description="Median value")
@@ -13,6 +13,7 @@ from src.consts import (
     TRIVY_CONCURRENCY,
     TRIVY_DB_WARMUP,
     TRIVY_DB_WARMUP_TIMEOUT,
+    TRIVY_SAVE_BATCH_SIZE,
     TRIVY_SKIP_DB_UPDATE_AFTER_WARMUP,
     TRIVY_UNSCANNABLE_IMAGES,
     TRIVY_VERBOSE_ERRORS,
@@ -37,6 +38,7 @@ class ScanOrchestrator:
         scan_cache: ScanCache,
         file_manager: FileManager,
         staleness_days: int = 7,
+        save_batch_size: int = TRIVY_SAVE_BATCH_SIZE,
     ):
         """Initialize ScanOrchestrator.
 
@@ -46,12 +48,15 @@ class ScanOrchestrator:
             scan_cache: ScanCache instance
             file_manager: FileManager instance for incremental saving
             staleness_days: Days after which to re-scan (default: 7)
+            save_batch_size: Successful scans to buffer before each incremental
+                save (1 saves after every scan)
         """
         self.scanner = scanner
         self.resolver = resolver
         self.scan_cache = scan_cache
         self.file_manager = file_manager
         self.staleness_days = staleness_days
+        self.save_batch_size = max(1, save_batch_size)
 
     def _get_cache_ttl_for_error(self, error_type: ScanErrorType) -> int:
         """Determine cache TTL based on error type.
@@ -150,21 +155,23 @@ class ScanOrchestrator:
                 logger.debug(f"Skipping {tool.id} (deprecated manifest schema v1)")
                 continue
 
+            # Check if needs scan (in-memory, before touching the failure cache)
+            if tool.security.status == SecurityStatus.UNKNOWN:
+                reason = "status UNKNOWN"
+            elif tool.security.trivy_scan_date is None:
+                reason = "never scanned"
+            elif tool.security.trivy_scan_date < staleness_threshold:
+                reason = "stale scan"
+            else:
+                continue
+
             # Skip if in failure cache
             if self.scan_cache.is_failed(tool.id):
                 logger.debug(f"Skipping {tool.id} (cached failure)")
                 continue
 
-            # Check if needs scan
-            if tool.security.status == SecurityStatus.UNKNOWN:
-                needs_scan.append(tool)
-                logger.debug(f"Adding {tool.id} (status UNKNOWN)")
-            elif tool.security.trivy_scan_date is None:
-                needs_scan.append(tool)
-                logger.debug(f"Adding {tool.id} (never scanned)")
-            elif tool.security.trivy_scan_date < staleness_threshold:
-                needs_scan.append(tool)
-                logger.debug(f"Adding {tool.id} (stale scan)")
+            needs_scan.append(tool)
+            logger.debug(f"Adding {tool.id} ({reason})")
 
         logger.info(f"Filtered {len(needs_scan)} tools needing scan from {len(tools)} total")
         return needs_scan
@@ -238,6 +245,8 @@ class ScanOrchestrator:
         Uses asyncio.Semaphore to limit parallel scans.
         Calls progress_callback(current, total) for CLI updates.
         Creates temporary cache directory to avoid lock conflicts.
+        Successful scans are saved incrementally, save_batch_size at a time,
+        and any remainder is saved when the batch ends or raises.
 
         Args:
             tools: List of tools to scan
@@ -260,6 +269,22 @@ class ScanOrchestrator:
         # original_cache_dir = self.scanner.cache_dir
         # self.scanner.cache_dir = cache_dir
 
+        # Successful scans waiting to be merged into tools.json
+        pending_saves: list[Tool] = []
+
+        def flush_saves() -> None:
+            """Save buffered scan results in a single merge."""
+            if not pending_saves:
+                return
+            batch = list(pending_saves)
+            pending_saves.clear()
+            try:
+                self.file_manager.save_processed(batch, merge=True)
+                logger.debug(f"Saved scan results for {len(batch)} tools")
+            except Exception as e:
+                logger.warning(f"Failed to save scan results for {len(batch)} tools: {e}")
+                # Don't fail the scan if save fails
+
         try:
             semaphore = asyncio.Semaphore(concurrency)
             updated_tools: list[Tool] = []
@@ -268,37 +293,55 @@ class ScanOrchestrator:
             failed = 0
             skipped = 0
             completed = 0
-
-            async def scan_one(tool: Tool) -> Tool | None:
-                """Scan a single tool."""
-                nonlocal completed, succeeded, failed, skipped
+            # Trivy scans started; unlike completed, excludes tools settled up front
+            scans_started = 0
+
+            # Settle cached failures and resolve image references up front.
+            # Both are synchronous, so the semaphore only gates Trivy scans.
+            scan_targets: list[tuple[Tool, str, str | None]] = []
+            for tool in tools:
+                try:
+                    is_failed = self.scan_cache.is_failed(tool.id)
+                    result_tuple = None if is_failed else self.resolver.resolve_image_ref(tool)
+                except Exception as e:
+                    # Like a crashing scan: record it for this tool, keep the batch going
+                    logger.warning(f"✗ {tool.id}: unexpected error before scan: {e}")
+                    failures[tool.id] = str(e) or type(e).__name__
+                    failed += 1
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, len(tools))
+                    continue
+
+                if is_failed:
+                    logger.debug(f"Skipping {tool.id} (cached failure)")
+                    skipped += 1
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, len(tools))
+                    continue
+
+                if not result_tuple:
+                    logger.warning(f"Could not resolve image for {tool.id}")
+                    failures[tool.id] = "Could not resolve image reference"
+                    failed += 1
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, len(tools))
+                    continue
+
+                image_ref, selected_tag = result_tuple
+                scan_targets.append((tool, image_ref, selected_tag))
+
+            async def scan_one(tool: Tool, image_ref: str, selected_tag: str | None) -> Tool | None:
+                """Scan a single tool whose image reference is already resolved."""
+                nonlocal completed, succeeded, failed, scans_started
 
                 async with semaphore:
-                    # Check failure cache
-                    if self.scan_cache.is_failed(tool.id):
-                        logger.debug(f"Skipping {tool.id} (cached failure)")
-                        skipped += 1
-                        completed += 1
-                        if progress_callback:
-                            progress_callback(completed, len(tools))
-                        return None
-
-                    # Resolve image reference
-                    result_tuple = self.resolver.resolve_image_ref(tool)
-                    if not result_tuple:
-                        logger.warning(f"Could not resolve image for {tool.id}")
-                        failures[tool.id] = "Could not resolve image reference"
-                        failed += 1
-                        completed += 1
-                        if progress_callback:
-                            progress_callback(completed, len(tools))
-                        return None
-
-                    image_ref, selected_tag = result_tuple
-
                     # Scan (with small delay to avoid cache lock race conditions)
-                    if completed > 0:
+                    if scans_started > 0:
                         await asyncio.sleep(0.5)  # 500ms delay between scans
+                    scans_started += 1
                     logger.info(f"Scanning {tool.id} ({image_ref}, tag={selected_tag})...")
                     result = await self.scanner.scan_image(image_ref)
 
@@ -311,13 +354,10 @@ class ScanOrchestrator:
                             f"{result.vulnerabilities.low}L"
                         )
 
-                        # Save immediately (incremental save)
-                        try:
-                            self.file_manager.save_processed([updated_tool], merge=True)
-                            logger.debug(f"Saved scan result for {tool.id}")
-                        except Exception as e:
-                            logger.warning(f"Failed to save {tool.id}: {e}")
-                            # Don't fail the scan if save fails
+                        # Incremental save, coalesced to avoid rewriting tools.json per scan
+                        pending_saves.append(updated_tool)
+                        if len(pending_saves) >= self.save_batch_size:
+                            flush_saves()
 
                         succeeded += 1
                         completed += 1
@@ -367,11 +407,25 @@ class ScanOrchestrator:
                             progress_callback(completed, len(tools))
                         return None
 
-            # Run all scans concurrently
-            results = await asyncio.gather(*[scan_one(tool) for tool in tools])
+            # Run all scans concurrently; an unexpected error in one scan is
+            # recorded as a failure instead of abandoning its peers mid-flight
+            results = await asyncio.gather(
+                *[scan_one(*target) for target in scan_targets], return_exceptions=True
+            )
 
-            # Filter out None results
-            updated_tools = [r for r in results if r is not None]
+            # Collect updated tools and unexpected errors
+            for (tool, _, _), outcome in zip(scan_targets, results, strict=True):
+                if isinstance(outcome, BaseException):
+                    if not isinstance(outcome, Exception):
+                        raise outcome
+                    logger.warning(f"✗ {tool.id}: unexpected scan error: {outcome}")
+                    failures[tool.id] = str(outcome) or type(outcome).__name__
+                    failed += 1
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, len(tools))
+                elif outcome is not None:
+                    updated_tools.append(outcome)
 
             duration = time.time() - start_time
 
@@ -386,10 +440,12 @@ class ScanOrchestrator:
             )
 
         finally:
+            # Save whatever is still buffered, also when a scan raised
+            flush_saves()
+
             # DISABLED: Cache isolation cleanup (see above)
             # self.scanner.cache_dir = original_cache_dir
             # self._cleanup_cache_dir(cache_dir)
-            pass
 
     def update_tool_security(self, tool: Tool, scan_result) -> Tool:
         """Update tool.security with scan results.
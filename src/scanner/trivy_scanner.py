@@ -1,14 +1,17 @@
 """Trivy CLI wrapper for Docker image vulnerability scanning."""
 
 import asyncio
-import json
 import logging
 import os
 import re
 import shutil
 import time
+from collections import Counter
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
 
 from src.consts import (
     TRIVY_CACHE_CLEANUP_THRESHOLD_SECONDS,
@@ -20,6 +23,10 @@ from src.models.model_tool import Vulnerabilities
 
 logger = logging.getLogger(__name__)
 
+# Parses Trivy's JSON report with pydantic-core's Rust parser; reports can
+# run to megabytes
+_TRIVY_REPORT_ADAPTER: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
 
 class TrivyScanner:
     """Wraps Trivy CLI for scanning Docker images."""
@@ -314,10 +321,10 @@ class TrivyScanner:
 
         if "@sha256:" in image_ref:
             # Digest reference
-            scanned_digest = image_ref.split("@")[-1]
+            scanned_digest = image_ref.rpartition("@")[2]
         elif ":" in image_ref:
             # Tag reference
-            scanned_tag = image_ref.split(":")[-1]
+            scanned_tag = image_ref.rpartition(":")[2]
 
         logger.info(f"Scanning image: {image_ref}")
 
@@ -642,15 +649,15 @@ class TrivyScanner:
             Vulnerabilities object with counts by severity
         """
         try:
-            data = json.loads(json_output)
-            counts = {"CRITICAL": 0, "HIGH": 0, "MEDIUM": 0, "LOW": 0}
+            data = _TRIVY_REPORT_ADAPTER.validate_json(json_output)
 
             # Trivy output structure: {"Results": [{"Vulnerabilities": [...]}]}
-            for result in data.get("Results", []):
-                for vuln in result.get("Vulnerabilities", []):
-                    severity = vuln.get("Severity", "UNKNOWN")
-                    if severity in counts:
-                        counts[severity] += 1
+            # Either list can be null, e.g. for a target without findings
+            counts = Counter(
+                vuln.get("Severity", "UNKNOWN")
+                for result in data.get("Results") or ()
+                for vuln in result.get("Vulnerabilities") or ()
+            )
 
             return Vulnerabilities(
                 critical=counts["CRITICAL"],
@@ -659,7 +666,8 @@ class TrivyScanner:
                 low=counts["LOW"],
             )
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Includes pydantic's ValidationError for malformed JSON
             logger.error(f"Failed to parse Trivy JSON output: {e}")
             # Return empty vulnerabilities on parse error
             return Vulnerabilities()
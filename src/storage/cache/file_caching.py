@@ -219,6 +219,32 @@ class FileCache(Cache):
 
         return keys
 
+    def items(self, category: str = "default") -> list[tuple[str, Any]]:
+        """List all original keys in a category together with their values.
+
+        Reads each entry file once, unlike list_keys() followed by get().
+
+        Args:
+            category: Category to list entries from.
+
+        Returns:
+            List of (original key, cached value) tuples for non-expired entries.
+        """
+        entries: list[tuple[str, Any]] = []
+        category_dir = self._category_dir(category)
+        if not category_dir.exists():
+            return entries
+
+        for path in category_dir.glob("*.json"):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if not self._is_expired(data):
+                    entries.append((data.get("original_key", path.stem), data.get("value")))
+            except (json.JSONDecodeError, KeyError):
+                continue
+
+        return entries
+
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
@@ -12,7 +12,9 @@ import json
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TypedDict
+
+from pydantic import TypeAdapter
 
 from src.consts import DEFAULT_DATA_DIR
 from src.models.model_stats import CategoryStats, GlobalStats
@@ -23,6 +25,20 @@ from src.storage.permanent_storage.base import PermanentStorage
 logger = logging.getLogger(__name__)
 
 
+class _ProcessedToolsFile(TypedDict, total=False):
+    """Part of processed/tools.json needed to load the tool list."""
+
+    tools: list[Tool]
+
+
+# Parses and validates tools.json in a single pydantic-core pass, without
+# building the intermediate dicts that json.loads would
+_PROCESSED_TOOLS_ADAPTER: TypeAdapter[_ProcessedToolsFile] = TypeAdapter(_ProcessedToolsFile)
+
+# Writes the already-dumped tools.json payload straight to JSON bytes
+_PROCESSED_FILE_ADAPTER: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+
 class FileManager(PermanentStorage):
     """File-based storage manager for tool data.
 
@@ -49,11 +65,24 @@ class FileManager(PermanentStorage):
         self._stats_dir = self._processed_dir / "stats"
         self._cache_dir = self.data_dir / "cache"
 
+        # Serialized processed catalog by tool id, as last written by
+        # save_processed(), and the (mtime_ns, size) of tools.json it matches
+        self._processed_index: dict[str, dict[str, Any]] | None = None
+        self._processed_stamp: tuple[int, int] | None = None
+
     def _ensure_dirs(self, *dirs: Path) -> None:
         """Create directories if they don't exist."""
         for d in dirs:
             d.mkdir(parents=True, exist_ok=True)
 
+    def _file_stamp(self, path: Path) -> tuple[int, int] | None:
+        """Get (mtime_ns, size) of a file, or None if it doesn't exist."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def _source_dir(self, source: SourceType | str) -> Path:
         """Get directory for a specific source."""
         source_name = source.value if isinstance(source, SourceType) else source
@@ -131,8 +160,7 @@ class FileManager(PermanentStorage):
             logger.warning(f"Raw scrape not found: {path}")
             return None
 
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return RawScrapeFile.model_validate(data)
+        return RawScrapeFile.model_validate_json(path.read_bytes())
 
     def list_raw_scrapes(self, source: SourceType | str) -> list[str]:
         """List available raw scrape dates for a source.
@@ -162,6 +190,11 @@ class FileManager(PermanentStorage):
         This is the merged result from all sources after filtering
         and categorization.
 
+        Merging reuses the catalog kept in memory from the previous save
+        while tools.json is unchanged on disk, so repeated incremental saves
+        don't re-read and re-validate the whole file. The file is replaced
+        atomically.
+
         Args:
             tools: List of processed tools to save.
             merge: If True, merge with existing tools instead of overwriting.
@@ -173,31 +206,44 @@ class FileManager(PermanentStorage):
         path = self._processed_dir / "tools.json"
 
         # Load existing tools if merge is enabled
-        existing_tools: dict[str, Tool] = {}
+        existing_tools: dict[str, dict[str, Any]] = {}
         if merge:
-            loaded = self.load_processed()
-            if loaded:
-                existing_tools = {tool.id: tool for tool in loaded}
-                logger.info(f"Loaded {len(existing_tools)} existing tools for merging")
+            if (
+                self._processed_index is not None
+                and self._file_stamp(path) == self._processed_stamp
+            ):
+                existing_tools = self._processed_index
+            else:
+                loaded = self.load_processed()
+                if loaded:
+                    existing_tools = {tool.id: tool.model_dump(mode="json") for tool in loaded}
+                    logger.info(f"Loaded {len(existing_tools)} existing tools for merging")
+
+        # Invalidate until the merged catalog is safely on disk
+        self._processed_index = None
+        self._processed_stamp = None
 
         # Merge new tools with existing ones
         new_count = 0
         for tool in tools:
             if tool.id not in existing_tools:
                 new_count += 1
-            existing_tools[tool.id] = tool
-
-        # Convert back to list
-        all_tools = list(existing_tools.values())
+            existing_tools[tool.id] = tool.model_dump(mode="json")
 
         data = {
             "version": "1.0",
             "updated_at": datetime.now(UTC).isoformat(),
-            "total_tools": len(all_tools),
-            "tools": [tool.model_dump(mode="json") for tool in all_tools],
+            "total_tools": len(existing_tools),
+            "tools": list(existing_tools.values()),
         }
-        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        logger.info(f"Saved processed tools: {path} ({len(all_tools)} total, {new_count} new)")
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(_PROCESSED_FILE_ADAPTER.dump_json(data, indent=2))
+        tmp_path.replace(path)
+
+        self._processed_index = existing_tools
+        self._processed_stamp = self._file_stamp(path)
+
+        logger.info(f"Saved processed tools: {path} ({len(existing_tools)} total, {new_count} new)")
         return path, new_count
 
     def load_processed(self) -> list[Tool] | None:
@@ -211,8 +257,8 @@ class FileManager(PermanentStorage):
             logger.warning(f"Processed tools not found: {path}")
             return None
 
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return [Tool.model_validate(t) for t in data.get("tools", [])]
+        data = _PROCESSED_TOOLS_ADAPTER.validate_json(path.read_bytes())
+        return data.get("tools", [])
 
     # === SCORES OPERATIONS ===
 
@@ -246,8 +292,7 @@ class FileManager(PermanentStorage):
             logger.warning(f"Scores not found: {path}")
             return None
 
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return ScoresFile.model_validate(data)
+        return ScoresFile.model_validate_json(path.read_bytes())
 
     # === STATISTICS OPERATIONS ===
 
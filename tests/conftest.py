@@ -1,6 +1,8 @@
 """Pytest configuration and fixtures."""
 
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import pytest
 
@@ -24,10 +26,44 @@ from src.models.model_tool import (
 )
 
 
+@pytest.fixture(scope="session")
+def now() -> datetime:
+    """Reference timestamp taken once per test session.
+
+    Uses the real clock (not a fixed date) so that code comparing against
+    datetime.now(UTC), such as staleness checks, still sees realistic ages.
+    """
+    return datetime.now(UTC)
+
+
+@pytest.fixture
+def make_tool(now: datetime) -> Callable[..., Tool]:
+    """Factory building unvalidated tools.
+
+    Nested models are passed in already built, so model_construct is safe
+    and skips re-validating literal, test-controlled inputs. Each call gets
+    its own nested models: metrics is built here and the rest come from the
+    field default factories.
+    """
+
+    def _make(name: str, **overrides: Any) -> Tool:
+        fields = {
+            "id": f"docker_hub:user/{name}",
+            "name": name,
+            "source": SourceType.DOCKER_HUB,
+            "source_url": f"https://hub.docker.com/r/user/{name}",
+            "metrics": Metrics(downloads=10_000, stars=200),
+            "scraped_at": now,
+            **overrides,
+        }
+        return Tool.model_construct(**fields)
+
+    return _make
+
+
 @pytest.fixture
-def sample_tool() -> Tool:
+def sample_tool(now: datetime) -> Tool:
     """Create a sample tool for testing."""
-    now = datetime.now(UTC)
     return Tool(
         id="docker_hub:library/postgres",
         name="postgres",
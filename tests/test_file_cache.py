@@ -96,6 +96,16 @@ class TestFileCache:
         keys = file_cache.list_keys("nonexistent")
         assert keys == []
 
+    def test_items(self, file_cache: FileCache) -> None:
+        """Test listing keys with their values in a category."""
+        file_cache.put("key1", {"a": 1}, "test")
+        file_cache.put("key2", "value2", "test")
+        file_cache.put("key3", "value3", "other")
+
+        items = dict(file_cache.items("test"))
+        assert items == {"key1": {"a": 1}, "key2": "value2"}
+        assert file_cache.items("nonexistent") == []
+
     def test_clear_category(self, file_cache: FileCache) -> None:
         """Test clearing specific category."""
         file_cache.put("key1", "value1", "category1")
@@ -4,6 +4,7 @@ import json
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -160,6 +161,37 @@ class TestFileManager:
         assert len(tools) == 2
         assert all(isinstance(t, Tool) for t in tools)
 
+    def test_save_processed_merge_reuses_saved_catalog(
+        self, file_manager: FileManager, sample_tools: list[Tool]
+    ) -> None:
+        """Test that consecutive merges don't re-read an unchanged tools.json."""
+        file_manager.save_processed(sample_tools[:1])
+
+        with patch.object(file_manager, "load_processed") as mock_load:
+            _, new_count = file_manager.save_processed(sample_tools[1:], merge=True)
+
+        mock_load.assert_not_called()
+        assert new_count == 1
+        tools = file_manager.load_processed()
+        assert tools is not None
+        assert {t.id for t in tools} == {t.id for t in sample_tools}
+
+    def test_save_processed_merge_sees_external_changes(
+        self, file_manager: FileManager, sample_tools: list[Tool]
+    ) -> None:
+        """Test that merging re-reads tools.json after it changed on disk."""
+        path, _ = file_manager.save_processed(sample_tools[:1])
+
+        # Another writer replaces the catalog
+        other = FileManager(data_dir=file_manager.data_dir)
+        other.save_processed(sample_tools[1:], merge=False)
+
+        _, new_count = file_manager.save_processed(sample_tools[:1], merge=True)
+
+        assert new_count == 1
+        data = json.loads(path.read_text())
+        assert {t["id"] for t in data["tools"]} == {t.id for t in sample_tools}
+
     def test_load_processed_nonexistent(self, file_manager: FileManager) -> None:
         """Test loading nonexistent processed tools."""
         tools = file_manager.load_processed()
@@ -100,6 +100,25 @@ class TestKeywordAssignmentCache:
         assert any(name == "postgres" for name, _ in entries)
         assert any(name == "redis" for name, _ in entries)
 
+    def test_get_entries_by_source(self, tmp_path: Path) -> None:
+        cache = KeywordAssignmentCache(tmp_path / "cache.json")
+        cache.set(
+            "postgres",
+            KeywordAssignmentCacheEntry(
+                assignment=KeywordAssignment(keywords=["cloud-native"]),
+                source="heuristic",
+            ),
+        )
+        cache.set(
+            "myapp",
+            KeywordAssignmentCacheEntry(assignment=KeywordAssignment(), source="fallback"),
+        )
+
+        entries = cache.get_entries_by_source("fallback")
+        assert [name for name, _ in entries] == ["myapp"]
+        assert entries[0][1].source == "fallback"
+        assert cache.get_entries_by_source("override") == []
+
 
 class TestKeywordAssigner:
     """Tests for KeywordAssigner class."""
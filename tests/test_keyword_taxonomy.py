@@ -3,6 +3,7 @@
 from src.categorization.keyword_taxonomy import (
     KEYWORD_CATEGORIES,
     KEYWORD_TAXONOMY_VERSION,
+    _index_keywords,
     get_all_categories,
     get_all_keywords,
     get_keyword_category,
@@ -198,6 +199,10 @@ class TestGetKeywordCategory:
     def test_get_category_for_nonexistent_keyword(self) -> None:
         assert get_keyword_category("nonexistent") is None
 
+    def test_duplicate_keyword_maps_to_first_category(self) -> None:
+        index = _index_keywords({"first": ("shared", "a"), "second": ("b", "shared")})
+        assert index == {"shared": "first", "a": "first", "b": "second"}
+
 
 class TestCategoryKeywordCounts:
     """Tests to verify keyword distribution across categories."""
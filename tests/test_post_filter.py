@@ -1,6 +1,7 @@
 """Tests for post-filtering logic."""
 
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -26,9 +27,9 @@ def post_filter() -> PostFilter:
     return PostFilter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def default_thresholds() -> FilterThresholds:
-    """Create default filter thresholds."""
+    """Default filter thresholds, shared across the module (the model is frozen)."""
     return FilterThresholds(
         min_downloads=1000,
         min_stars=100,
@@ -38,13 +39,11 @@ def default_thresholds() -> FilterThresholds:
 
 
 @pytest.fixture
-def high_score_tool() -> Tool:
-    """Create a high-scoring tool that should be visible."""
-    now = datetime.now(UTC)
-    return Tool(
+def high_score_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A high-scoring tool that should be visible."""
+    return make_tool(
+        "postgres",
         id="docker_hub:library/postgres",
-        name="postgres",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/_/postgres",
         description="Official PostgreSQL image",
         metrics=Metrics(downloads=1_000_000_000, stars=10_000),
@@ -54,248 +53,187 @@ def high_score_tool() -> Tool:
         ),
         lifecycle=Lifecycle.STABLE,
         quality_score=85.0,
-        scraped_at=now,
     )
 
 
 @pytest.fixture
-def stale_tool() -> Tool:
-    """Create a stale tool (not updated in over 365 days)."""
-    now = datetime.now(UTC)
-    return Tool(
+def stale_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A stale tool (not updated in over 365 days)."""
+    return make_tool(
+        "stale-tool",
         id="docker_hub:user/stale",
-        name="stale-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/stale",
         description="Not updated in years",
         metrics=Metrics(downloads=100_000, stars=200),
         maintenance=Maintenance(last_updated=now - timedelta(days=500)),
         quality_score=60.0,
-        scraped_at=now,
     )
 
 
 @pytest.fixture
-def low_downloads_tool() -> Tool:
-    """Create a tool with low downloads."""
-    now = datetime.now(UTC)
-    return Tool(
+def low_downloads_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A tool with low downloads."""
+    return make_tool(
+        "unpopular-tool",
         id="docker_hub:user/unpopular",
-        name="unpopular-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/unpopular",
         description="Not many downloads",
         metrics=Metrics(downloads=500, stars=150),
         maintenance=Maintenance(last_updated=now - timedelta(days=10)),
         quality_score=55.0,
-        scraped_at=now,
     )
 
 
 @pytest.fixture
-def low_stars_tool() -> Tool:
-    """Create a tool with low stars."""
-    now = datetime.now(UTC)
-    return Tool(
+def low_stars_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A tool with low stars."""
+    return make_tool(
+        "few-stars-tool",
         id="docker_hub:user/few-stars",
-        name="few-stars-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/few-stars",
         description="Not many stars",
         metrics=Metrics(downloads=10_000, stars=50),
         maintenance=Maintenance(last_updated=now - timedelta(days=10)),
         quality_score=55.0,
-        scraped_at=now,
     )
 
 
 @pytest.fixture
-def experimental_tool() -> Tool:
-    """Create an experimental tool that should be hidden."""
-    now = datetime.now(UTC)
-    return Tool(
+def experimental_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """An experimental tool that should be hidden."""
+    return make_tool(
+        "experimental-tool",
         id="docker_hub:user/experimental",
-        name="experimental-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/experimental",
         description="Still in experimental phase",
         metrics=Metrics(downloads=50_000, stars=300),
         maintenance=Maintenance(last_updated=now - timedelta(days=5)),
         lifecycle=Lifecycle.EXPERIMENTAL,
         quality_score=70.0,
-        scraped_at=now,
     )
 
 
 @pytest.fixture
-def legacy_tool() -> Tool:
-    """Create a legacy tool that should be hidden."""
-    now = datetime.now(UTC)
-    return Tool(
+def legacy_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A legacy tool that should be hidden."""
+    return make_tool(
+        "legacy-tool",
         id="docker_hub:user/legacy",
-        name="legacy-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/legacy",
         description="Legacy but still maintained",
         metrics=Metrics(downloads=200_000, stars=500),
         maintenance=Maintenance(last_updated=now - timedelta(days=60)),
         lifecycle=Lifecycle.LEGACY,
         quality_score=65.0,
-        scraped_at=now,
     )
 
 
 @pytest.fixture
-def low_score_tool() -> Tool:
-    """Create a tool with low score (between min_score and min_score*1.5)."""
-    now = datetime.now(UTC)
-    return Tool(
+def low_score_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A tool with low score (between min_score and min_score*1.5)."""
+    return make_tool(
+        "lowscore-tool",
         id="docker_hub:user/lowscore",
-        name="lowscore-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/lowscore",
         description="Low quality score",
         metrics=Metrics(downloads=10_000, stars=150),
         maintenance=Maintenance(last_updated=now - timedelta(days=30)),
         lifecycle=Lifecycle.ACTIVE,
         quality_score=35.0,
-        scraped_at=now,
     )
 
 
 @pytest.fixture
-def very_low_score_tool() -> Tool:
-    """Create a tool with very low score (below min_score*0.5)."""
-    now = datetime.now(UTC)
-    return Tool(
+def very_low_score_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A tool with very low score (below min_score*0.5)."""
+    return make_tool(
+        "verylowscore-tool",
         id="docker_hub:user/verylowscore",
-        name="verylowscore-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/verylowscore",
         description="Very low quality score",
         metrics=Metrics(downloads=5_000, stars=120),
         maintenance=Maintenance(last_updated=now - timedelta(days=20)),
         lifecycle=Lifecycle.ACTIVE,
         quality_score=10.0,
-        scraped_at=now,
     )
 
 
 class TestPostFilter:
     """Tests for PostFilter class."""
 
-    def test_high_score_tool_visible(
-        self,
-        post_filter: PostFilter,
-        default_thresholds: FilterThresholds,
-        high_score_tool: Tool,
-    ) -> None:
-        """Test that high-scoring tools remain visible."""
-        result = post_filter.apply([high_score_tool], default_thresholds)
-        assert len(result) == 1
-        assert result[0].id == high_score_tool.id
-        assert result[0].filter_status.state == FilterState.VISIBLE
-
-    def test_stale_tool_excluded(
-        self,
-        post_filter: PostFilter,
-        default_thresholds: FilterThresholds,
-        stale_tool: Tool,
-    ) -> None:
-        """Test that stale tools are excluded."""
-        result = post_filter.apply([stale_tool], default_thresholds)
-        assert len(result) == 0
-        assert stale_tool.filter_status.state == FilterState.EXCLUDED
-        assert FilterReasons.STALE in stale_tool.filter_status.reasons
-
-    def test_low_downloads_excluded(
+    @pytest.mark.parametrize(
+        ("tool_fixture", "expected_state", "expected_reason"),
+        [
+            pytest.param("high_score_tool", FilterState.VISIBLE, None, id="high-score-visible"),
+            pytest.param("stale_tool", FilterState.EXCLUDED, FilterReasons.STALE, id="stale"),
+            pytest.param(
+                "low_downloads_tool",
+                FilterState.EXCLUDED,
+                FilterReasons.LOW_DOWNLOADS,
+                id="low-downloads",
+            ),
+            pytest.param(
+                "low_stars_tool", FilterState.EXCLUDED, FilterReasons.LOW_DOWNLOADS, id="low-stars"
+            ),
+            pytest.param(
+                "experimental_tool",
+                FilterState.HIDDEN,
+                FilterReasons.EXPERIMENTAL,
+                id="experimental",
+            ),
+            pytest.param("legacy_tool", FilterState.HIDDEN, FilterReasons.LEGACY, id="legacy"),
+            pytest.param(
+                "low_score_tool", FilterState.HIDDEN, FilterReasons.LOW_SCORE, id="low-score"
+            ),
+            pytest.param(
+                "very_low_score_tool",
+                FilterState.EXCLUDED,
+                FilterReasons.LOW_SCORE,
+                id="very-low-score",
+            ),
+        ],
+    )
+    def test_single_tool_state(
         self,
+        request: pytest.FixtureRequest,
         post_filter: PostFilter,
         default_thresholds: FilterThresholds,
-        low_downloads_tool: Tool,
+        tool_fixture: str,
+        expected_state: FilterState,
+        expected_reason: str | None,
     ) -> None:
-        """Test that tools with low downloads are excluded."""
-        result = post_filter.apply([low_downloads_tool], default_thresholds)
-        assert len(result) == 0
-        assert low_downloads_tool.filter_status.state == FilterState.EXCLUDED
-        assert FilterReasons.LOW_DOWNLOADS in low_downloads_tool.filter_status.reasons
+        """Test the state and reason assigned to a single tool.
 
-    def test_low_stars_excluded(
-        self,
-        post_filter: PostFilter,
-        default_thresholds: FilterThresholds,
-        low_stars_tool: Tool,
-    ) -> None:
-        """Test that tools with low stars are excluded."""
-        result = post_filter.apply([low_stars_tool], default_thresholds)
-        assert len(result) == 0
-        assert low_stars_tool.filter_status.state == FilterState.EXCLUDED
-        assert FilterReasons.LOW_DOWNLOADS in low_stars_tool.filter_status.reasons
+        Excluded tools are dropped from the result; visible and hidden
+        tools are returned.
+        """
+        tool: Tool = request.getfixturevalue(tool_fixture)
+        result = post_filter.apply([tool], default_thresholds)
 
-    def test_experimental_tool_hidden(
-        self,
-        post_filter: PostFilter,
-        default_thresholds: FilterThresholds,
-        experimental_tool: Tool,
-    ) -> None:
-        """Test that experimental tools are hidden."""
-        result = post_filter.apply([experimental_tool], default_thresholds)
-        assert len(result) == 1
-        assert result[0].filter_status.state == FilterState.HIDDEN
-        assert FilterReasons.EXPERIMENTAL in result[0].filter_status.reasons
+        assert tool.filter_status.state == expected_state
+        if expected_state == FilterState.EXCLUDED:
+            assert len(result) == 0
+        else:
+            assert len(result) == 1
+            assert result[0].id == tool.id
 
-    def test_legacy_tool_hidden(
-        self,
-        post_filter: PostFilter,
-        default_thresholds: FilterThresholds,
-        legacy_tool: Tool,
-    ) -> None:
-        """Test that legacy tools are hidden."""
-        result = post_filter.apply([legacy_tool], default_thresholds)
-        assert len(result) == 1
-        assert result[0].filter_status.state == FilterState.HIDDEN
-        assert FilterReasons.LEGACY in result[0].filter_status.reasons
-
-    def test_low_score_hidden(
-        self,
-        post_filter: PostFilter,
-        default_thresholds: FilterThresholds,
-        low_score_tool: Tool,
-    ) -> None:
-        """Test that low score tools are hidden."""
-        result = post_filter.apply([low_score_tool], default_thresholds)
-        assert len(result) == 1
-        assert result[0].filter_status.state == FilterState.HIDDEN
-        assert FilterReasons.LOW_SCORE in result[0].filter_status.reasons
-
-    def test_very_low_score_excluded(
-        self,
-        post_filter: PostFilter,
-        default_thresholds: FilterThresholds,
-        very_low_score_tool: Tool,
-    ) -> None:
-        """Test that very low score tools are excluded."""
-        result = post_filter.apply([very_low_score_tool], default_thresholds)
-        assert len(result) == 0
-        assert very_low_score_tool.filter_status.state == FilterState.EXCLUDED
-        assert FilterReasons.LOW_SCORE in very_low_score_tool.filter_status.reasons
+        if expected_reason is None:
+            assert tool.filter_status.reasons == []
+        else:
+            assert expected_reason in tool.filter_status.reasons
 
     def test_already_excluded_skipped(
         self,
         post_filter: PostFilter,
         default_thresholds: FilterThresholds,
+        make_tool: Callable[..., Tool],
+        now: datetime,
     ) -> None:
         """Test that already excluded tools are skipped."""
-        now = datetime.now(UTC)
-        tool = Tool(
-            id="docker_hub:user/excluded",
-            name="excluded",
-            source=SourceType.DOCKER_HUB,
-            source_url="https://hub.docker.com/r/user/excluded",
-            metrics=Metrics(downloads=10_000, stars=200),
+        tool = make_tool(
+            "excluded",
             maintenance=Maintenance(last_updated=now),
             quality_score=80.0,
-            scraped_at=now,
         )
         # Pre-mark as excluded
         tool.filter_status.state = FilterState.EXCLUDED
@@ -306,13 +244,35 @@ class TestPostFilter:
         assert len(result) == 0
         assert tool.filter_status.state == FilterState.EXCLUDED
 
+    @pytest.mark.parametrize(
+        ("days_ago", "expected_state"),
+        [(365, FilterState.VISIBLE), (366, FilterState.EXCLUDED)],
+    )
+    def test_staleness_boundary(
+        self,
+        post_filter: PostFilter,
+        default_thresholds: FilterThresholds,
+        make_tool: Callable[..., Tool],
+        now: datetime,
+        days_ago: int,
+        expected_state: FilterState,
+    ) -> None:
+        """Test that a tool becomes stale only after max_days_since_update full days."""
+        tool = make_tool(
+            "boundary",
+            maintenance=Maintenance(last_updated=now - timedelta(days=days_ago)),
+            quality_score=80.0,
+        )
+        post_filter.apply([tool], default_thresholds)
+        assert tool.filter_status.state == expected_state
+
     def test_no_last_updated_skips_staleness_check(
         self,
         post_filter: PostFilter,
         default_thresholds: FilterThresholds,
+        now: datetime,
     ) -> None:
         """Test that tools without last_updated skip staleness check."""
-        now = datetime.now(UTC)
         tool = Tool(
             id="docker_hub:user/no-update-time",
             name="no-update-time",
@@ -332,9 +292,9 @@ class TestPostFilter:
         self,
         post_filter: PostFilter,
         default_thresholds: FilterThresholds,
+        now: datetime,
     ) -> None:
         """Test that tools without quality_score skip score checks."""
-        now = datetime.now(UTC)
         tool = Tool(
             id="docker_hub:user/no-score",
             name="no-score",
@@ -375,10 +335,8 @@ class TestPostFilter:
         assert len(hidden) == 1
         assert hidden[0].id == experimental_tool.id
 
-    def test_custom_thresholds(self, post_filter: PostFilter) -> None:
+    def test_custom_thresholds(self, post_filter: PostFilter, now: datetime) -> None:
         """Test with custom thresholds."""
-        now = datetime.now(UTC)
-
         # First test with strict thresholds
         tool1 = Tool(
             id="docker_hub:user/custom1",
@@ -423,9 +381,8 @@ class TestPostFilter:
         result_lenient = post_filter.apply([tool2], lenient)
         assert len(result_lenient) == 1
 
-    def test_days_since_update_calculation(self, post_filter: PostFilter) -> None:
+    def test_days_since_update_calculation(self, post_filter: PostFilter, now: datetime) -> None:
         """Test days since update calculation."""
-        now = datetime.now(UTC)
         tool = Tool(
             id="docker_hub:user/test",
             name="test",
@@ -448,20 +405,16 @@ class TestPostFilter:
         self,
         post_filter: PostFilter,
         default_thresholds: FilterThresholds,
+        make_tool: Callable[..., Tool],
+        now: datetime,
     ) -> None:
         """Test that filter reasons are not duplicated."""
-        now = datetime.now(UTC)
         # Use good enough metrics to not trigger exclusion
-        tool = Tool(
-            id="docker_hub:user/experimental-good",
-            name="experimental-good",
-            source=SourceType.DOCKER_HUB,
-            source_url="https://hub.docker.com/r/user/experimental-good",
-            metrics=Metrics(downloads=10_000, stars=200),
+        tool = make_tool(
+            "experimental-good",
             maintenance=Maintenance(last_updated=now - timedelta(days=10)),
             lifecycle=Lifecycle.EXPERIMENTAL,
             quality_score=70.0,
-            scraped_at=now,
         )
 
         # Apply multiple times (shouldn't happen in practice)
@@ -469,7 +422,7 @@ class TestPostFilter:
         post_filter.apply([tool], default_thresholds)
 
         # Should only have one EXPERIMENTAL reason
-        assert tool.filter_status.reasons.count(FilterReasons.EXPERIMENTAL) == 1
+        assert tool.filter_status.reasons == [FilterReasons.EXPERIMENTAL]
 
 
 def test_post_filter_empty_list() -> None:
@@ -480,7 +433,7 @@ def test_post_filter_empty_list() -> None:
     assert len(result) == 0
 
 
-def test_post_filter_all_visible() -> None:
+def test_post_filter_all_visible(make_tool: Callable[..., Tool], now: datetime) -> None:
     """Test post-filter where all tools remain visible."""
     post_filter = PostFilter()
     thresholds = FilterThresholds(
@@ -489,18 +442,18 @@ def test_post_filter_all_visible() -> None:
         max_days_since_update=365,
         min_score=10.0,
     )
-    now = datetime.now(UTC)
+    # Nested models are read-only for PostFilter, so one instance is shared
+    metrics = Metrics(downloads=10000, stars=100)
+    maintenance = Maintenance(last_updated=now - timedelta(days=30))
     tools = [
-        Tool(
+        make_tool(
+            f"tool{i}",
             id=f"docker_hub:library/tool{i}",
-            name=f"tool{i}",
-            source=SourceType.DOCKER_HUB,
             source_url=f"https://hub.docker.com/_/tool{i}",
-            metrics=Metrics(downloads=10000, stars=100),
-            maintenance=Maintenance(last_updated=now - timedelta(days=30)),
+            metrics=metrics,
+            maintenance=maintenance,
             lifecycle=Lifecycle.STABLE,
             quality_score=80.0,
-            scraped_at=now,
         )
         for i in range(5)
     ]
@@ -509,7 +462,7 @@ def test_post_filter_all_visible() -> None:
     assert all(t.filter_status.state == FilterState.VISIBLE for t in result)
 
 
-def test_post_filter_all_excluded() -> None:
+def test_post_filter_all_excluded(make_tool: Callable[..., Tool], now: datetime) -> None:
     """Test post-filter where all tools are excluded."""
     post_filter = PostFilter()
     thresholds = FilterThresholds(
@@ -518,18 +471,10 @@ def test_post_filter_all_excluded() -> None:
         max_days_since_update=30,
         min_score=80.0,
     )
-    now = datetime.now(UTC)
+    metrics = Metrics(downloads=100, stars=10)
+    maintenance = Maintenance(last_updated=now - timedelta(days=100))
     tools = [
-        Tool(
-            id=f"docker_hub:user/bad{i}",
-            name=f"bad{i}",
-            source=SourceType.DOCKER_HUB,
-            source_url=f"https://hub.docker.com/r/user/bad{i}",
-            metrics=Metrics(downloads=100, stars=10),
-            maintenance=Maintenance(last_updated=now - timedelta(days=100)),
-            quality_score=20.0,
-            scraped_at=now,
-        )
+        make_tool(f"bad{i}", metrics=metrics, maintenance=maintenance, quality_score=20.0)
         for i in range(5)
     ]
     result = post_filter.apply(tools, thresholds)
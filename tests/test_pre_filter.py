@@ -1,6 +1,7 @@
 """Tests for pre-filtering logic."""
 
-from datetime import UTC, datetime
+from collections.abc import Callable
+from datetime import datetime
 
 import pytest
 
@@ -17,88 +18,78 @@ from src.models.model_tool import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pre_filter() -> PreFilter:
-    """Create a PreFilter instance."""
+    """Shared PreFilter; apply() writes only to the tools, never to the filter."""
     return PreFilter()
 
 
 @pytest.fixture
-def valid_tool() -> Tool:
-    """Create a valid tool that should pass pre-filtering."""
-    return Tool(
+def valid_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A valid tool that should pass pre-filtering."""
+    return make_tool(
+        "postgres",
         id="docker_hub:library/postgres",
-        name="postgres",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/_/postgres",
         description="Official PostgreSQL image",
         maintainer=Maintainer(name="Docker", type=MaintainerType.OFFICIAL, verified=True),
         metrics=Metrics(downloads=1_000_000_000, stars=10_000),
         maintenance=Maintenance(
-            last_updated=datetime.now(UTC),
+            last_updated=now,
             is_deprecated=False,
         ),
-        scraped_at=datetime.now(UTC),
     )
 
 
 @pytest.fixture
-def zero_metrics_tool() -> Tool:
-    """Create a tool with zero metrics."""
-    return Tool(
+def zero_metrics_tool(make_tool: Callable[..., Tool]) -> Tool:
+    """A tool with zero metrics."""
+    return make_tool(
+        "abandoned-tool",
         id="docker_hub:user/abandoned",
-        name="abandoned-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/abandoned",
         description="An abandoned tool with no usage",
         metrics=Metrics(downloads=0, stars=0),
-        scraped_at=datetime.now(UTC),
     )
 
 
 @pytest.fixture
-def deprecated_tool() -> Tool:
-    """Create a deprecated tool."""
-    return Tool(
+def deprecated_tool(make_tool: Callable[..., Tool], now: datetime) -> Tool:
+    """A deprecated tool."""
+    return make_tool(
+        "legacy-tool",
         id="docker_hub:user/legacy",
-        name="legacy-tool",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/legacy",
         description="A deprecated legacy tool",
         metrics=Metrics(downloads=50_000, stars=100),
         maintenance=Maintenance(
-            last_updated=datetime.now(UTC),
+            last_updated=now,
             is_deprecated=True,
         ),
-        scraped_at=datetime.now(UTC),
     )
 
 
 @pytest.fixture
-def spam_name_tool() -> Tool:
-    """Create a tool with spam in name."""
-    return Tool(
+def spam_name_tool(make_tool: Callable[..., Tool]) -> Tool:
+    """A tool with spam in name."""
+    return make_tool(
+        "test-image",
         id="docker_hub:user/test-image",
-        name="test-image",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/test-image",
         description="Just a test image",
         metrics=Metrics(downloads=100, stars=0),
-        scraped_at=datetime.now(UTC),
     )
 
 
 @pytest.fixture
-def spam_description_tool() -> Tool:
-    """Create a tool with spam in description."""
-    return Tool(
+def spam_description_tool(make_tool: Callable[..., Tool]) -> Tool:
+    """A tool with spam in description."""
+    return make_tool(
+        "myapp",
         id="docker_hub:user/myapp",
-        name="myapp",
-        source=SourceType.DOCKER_HUB,
         source_url="https://hub.docker.com/r/user/myapp",
         description="This is a placeholder for my app",
         metrics=Metrics(downloads=50, stars=1),
-        scraped_at=datetime.now(UTC),
     )
 
 
@@ -148,30 +139,29 @@ class TestPreFilter:
         assert spam_description_tool.filter_status.state == FilterState.EXCLUDED
         assert FilterReasons.SPAM in spam_description_tool.filter_status.reasons
 
-    def test_nonzero_downloads_passes(self, pre_filter: PreFilter) -> None:
+    def test_nonzero_downloads_passes(
+        self, pre_filter: PreFilter, make_tool: Callable[..., Tool]
+    ) -> None:
         """Test that tools with downloads but no stars pass."""
-        tool = Tool(
-            id="docker_hub:user/downloaded",
-            name="downloaded",
-            source=SourceType.DOCKER_HUB,
-            source_url="https://hub.docker.com/r/user/downloaded",
+        tool = make_tool(
+            "downloaded",
             description="Tool with downloads but no stars",
             metrics=Metrics(downloads=1000, stars=0),
-            scraped_at=datetime.now(UTC),
         )
         result = pre_filter.apply([tool])
         assert len(result) == 1
 
-    def test_nonzero_stars_passes(self, pre_filter: PreFilter) -> None:
+    def test_nonzero_stars_passes(
+        self, pre_filter: PreFilter, make_tool: Callable[..., Tool]
+    ) -> None:
         """Test that tools with stars but no downloads pass."""
-        tool = Tool(
+        tool = make_tool(
+            "starred",
             id="github:user/starred",
-            name="starred",
             source=SourceType.GITHUB,
             source_url="https://github.com/user/starred",
             description="Tool with stars but no downloads",
             metrics=Metrics(downloads=0, stars=100),
-            scraped_at=datetime.now(UTC),
         )
         result = pre_filter.apply([tool])
         assert len(result) == 1
@@ -189,70 +179,53 @@ class TestPreFilter:
         assert len(result) == 1
         assert result[0].id == valid_tool.id
 
-    def test_spam_patterns_case_insensitive(self, pre_filter: PreFilter) -> None:
+    def test_spam_patterns_case_insensitive(
+        self, pre_filter: PreFilter, make_tool: Callable[..., Tool]
+    ) -> None:
         """Test that spam patterns are case-insensitive."""
-        tool = Tool(
-            id="docker_hub:user/TEST-image",
-            name="TEST-image",
-            source=SourceType.DOCKER_HUB,
-            source_url="https://hub.docker.com/r/user/TEST-image",
+        tool = make_tool(
+            "TEST-image",
             description="An IMAGE for TESTING",
             metrics=Metrics(downloads=100, stars=0),
-            scraped_at=datetime.now(UTC),
         )
         result = pre_filter.apply([tool])
         assert len(result) == 0
         assert tool.filter_status.state == FilterState.EXCLUDED
 
-    def test_spam_patterns_word_boundary(self, pre_filter: PreFilter) -> None:
+    def test_spam_patterns_word_boundary(
+        self, pre_filter: PreFilter, make_tool: Callable[..., Tool]
+    ) -> None:
         """Test that spam patterns respect word boundaries."""
         # "test" as substring shouldn't trigger (e.g., "latest" or "fastest")
-        tool = Tool(
-            id="docker_hub:user/latest-version",
-            name="latest-version",
-            source=SourceType.DOCKER_HUB,
-            source_url="https://hub.docker.com/r/user/latest-version",
+        tool = make_tool(
+            "latest-version",
             description="The latest version of the tool",
             metrics=Metrics(downloads=1000, stars=10),
-            scraped_at=datetime.now(UTC),
         )
         result = pre_filter.apply([tool])
         # Should pass since "test" in "latest" is not a word boundary match
         assert len(result) == 1
 
-    def test_prefix_spam_patterns(self, pre_filter: PreFilter) -> None:
+    def test_prefix_spam_patterns(
+        self, pre_filter: PreFilter, make_tool: Callable[..., Tool]
+    ) -> None:
         """Test prefix spam patterns like 'test-', 'demo-'."""
+        metrics = Metrics(downloads=100, stars=0)
         tools = [
-            Tool(
-                id="docker_hub:user/test-app",
-                name="test-app",
-                source=SourceType.DOCKER_HUB,
-                source_url="https://hub.docker.com/r/user/test-app",
-                metrics=Metrics(downloads=100, stars=0),
-                scraped_at=datetime.now(UTC),
-            ),
-            Tool(
-                id="docker_hub:user/demo-service",
-                name="demo-service",
-                source=SourceType.DOCKER_HUB,
-                source_url="https://hub.docker.com/r/user/demo-service",
-                metrics=Metrics(downloads=100, stars=0),
-                scraped_at=datetime.now(UTC),
-            ),
+            make_tool("test-app", metrics=metrics),
+            make_tool("demo-service", metrics=metrics),
         ]
         result = pre_filter.apply(tools)
         assert len(result) == 0
 
-    def test_no_duplicate_reasons(self, pre_filter: PreFilter) -> None:
+    def test_no_duplicate_reasons(
+        self, pre_filter: PreFilter, make_tool: Callable[..., Tool]
+    ) -> None:
         """Test that filter reasons are not duplicated."""
-        tool = Tool(
-            id="docker_hub:user/bad",
-            name="bad",
-            source=SourceType.DOCKER_HUB,
-            source_url="https://hub.docker.com/r/user/bad",
+        tool = make_tool(
+            "bad",
             description="bad",
             metrics=Metrics(downloads=0, stars=0),
-            scraped_at=datetime.now(UTC),
         )
         # Apply twice (shouldn't happen in practice, but test robustness)
         pre_filter.apply([tool])
@@ -260,64 +233,43 @@ class TestPreFilter:
         # Should only have one LOW_DOWNLOADS reason
         assert tool.filter_status.reasons.count(FilterReasons.LOW_DOWNLOADS) == 1
 
-    def test_fork_detection_placeholder(self, pre_filter: PreFilter) -> None:
+    def test_fork_detection_placeholder(
+        self, pre_filter: PreFilter, make_tool: Callable[..., Tool]
+    ) -> None:
         """Test fork detection placeholder (not yet implemented)."""
         # For now, fork detection returns False
         # This test documents the expected behavior when implemented
-        tool = Tool(
+        tool = make_tool(
+            "forked-repo",
             id="github:user/forked-repo",
-            name="forked-repo",
             source=SourceType.GITHUB,
             source_url="https://github.com/user/forked-repo",
             description="A forked repository",
             metrics=Metrics(downloads=100, stars=10),
-            scraped_at=datetime.now(UTC),
         )
         result = pre_filter.apply([tool])
         # Should pass for now since fork detection is not implemented
         assert len(result) == 1
 
 
-def test_pre_filter_empty_list() -> None:
+def test_pre_filter_empty_list(pre_filter: PreFilter) -> None:
     """Test pre-filter with empty tool list."""
-    pre_filter = PreFilter()
     result = pre_filter.apply([])
     assert len(result) == 0
 
 
-def test_pre_filter_all_pass() -> None:
+def test_pre_filter_all_pass(pre_filter: PreFilter, make_tool: Callable[..., Tool]) -> None:
     """Test pre-filter where all tools pass."""
-    pre_filter = PreFilter()
-    tools = [
-        Tool(
-            id=f"docker_hub:library/tool{i}",
-            name=f"tool{i}",
-            source=SourceType.DOCKER_HUB,
-            source_url=f"https://hub.docker.com/_/tool{i}",
-            description=f"Tool {i}",
-            metrics=Metrics(downloads=10000, stars=100),
-            scraped_at=datetime.now(UTC),
-        )
-        for i in range(5)
-    ]
+    tools = [make_tool(f"tool{i}", description=f"Tool {i}") for i in range(5)]
     result = pre_filter.apply(tools)
     assert len(result) == 5
 
 
-def test_pre_filter_all_excluded() -> None:
+def test_pre_filter_all_excluded(
+    pre_filter: PreFilter, make_tool: Callable[..., Tool]
+) -> None:
     """Test pre-filter where all tools are excluded."""
-    pre_filter = PreFilter()
-    tools = [
-        Tool(
-            id=f"docker_hub:user/test{i}",
-            name=f"test{i}",
-            source=SourceType.DOCKER_HUB,
-            source_url=f"https://hub.docker.com/r/user/test{i}",
-            description="test",
-            metrics=Metrics(downloads=0, stars=0),
-            scraped_at=datetime.now(UTC),
-        )
-        for i in range(5)
-    ]
+    metrics = Metrics(downloads=0, stars=0)
+    tools = [make_tool(f"test{i}", description="test", metrics=metrics) for i in range(5)]
     result = pre_filter.apply(tools)
     assert len(result) == 0
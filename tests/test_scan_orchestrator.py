@@ -1,6 +1,8 @@
 """Tests for ScanOrchestrator with incremental saving."""
 
+import asyncio
 import tempfile
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,9 +15,7 @@ from src.models.model_tool import (
     Maintainer,
     MaintainerType,
     Metrics,
-    Security,
     SecurityStatus,
-    SourceType,
     Tool,
     Vulnerabilities,
 )
@@ -50,31 +50,27 @@ class TestScanOrchestrator:
         return ScanCache(file_cache, failed_scan_ttl=3600)
 
     @pytest.fixture
-    def sample_tools(self) -> list[Tool]:
+    def sample_tools(self, make_tool: Callable[..., Tool]) -> list[Tool]:
         """Create sample tools for testing."""
         return [
-            Tool(
+            make_tool(
+                "postgres",
                 id="docker_hub:library/postgres",
-                name="postgres",
-                source=SourceType.DOCKER_HUB,
                 source_url="https://hub.docker.com/_/postgres",
                 description="PostgreSQL",
                 identity=Identity(canonical_name="postgres"),
                 maintainer=Maintainer(name="Docker", type=MaintainerType.OFFICIAL),
                 metrics=Metrics(),
-                security=Security(),
                 docker_tags=["latest", "stable", "alpine"],
             ),
-            Tool(
+            make_tool(
+                "redis",
                 id="docker_hub:library/redis",
-                name="redis",
-                source=SourceType.DOCKER_HUB,
                 source_url="https://hub.docker.com/_/redis",
                 description="Redis",
                 identity=Identity(canonical_name="redis"),
                 maintainer=Maintainer(name="Docker", type=MaintainerType.OFFICIAL),
                 metrics=Metrics(),
-                security=Security(),
                 docker_tags=["latest", "alpine"],
             ),
         ]
@@ -86,7 +82,7 @@ class TestScanOrchestrator:
         scan_cache: ScanCache,
         sample_tools: list[Tool],
     ) -> None:
-        """Test that scan_batch saves after each successful scan."""
+        """Test that scan_batch saves after each successful scan with save_batch_size=1."""
         scanner = TrivyScanner()
         resolver = ImageResolver()
         orchestrator = ScanOrchestrator(
@@ -95,6 +91,7 @@ class TestScanOrchestrator:
             scan_cache=scan_cache,
             file_manager=file_manager,
             staleness_days=7,
+            save_batch_size=1,
         )
 
         # Mock successful scans
@@ -127,8 +124,10 @@ class TestScanOrchestrator:
             save_calls.append(tools)
             return original_save(tools, merge=merge)
 
+        # Skip DB warmup so it doesn't consume one of the mocked scan results
         with patch.object(file_manager, "save_processed", side_effect=mock_save), \
-             patch.object(scanner, "scan_image", side_effect=scan_results):
+             patch.object(scanner, "scan_image", side_effect=scan_results), \
+             patch.object(orchestrator, "_warmup_trivy_db", AsyncMock(return_value=True)):
             result = await orchestrator.scan_batch(sample_tools, concurrency=1)
 
             # Should have saved twice (once for each successful scan)
@@ -144,6 +143,56 @@ class TestScanOrchestrator:
             assert save_calls[0][0].security.scanned_tag == "stable"
             assert save_calls[1][0].security.scanned_tag == "alpine"
 
+    @pytest.mark.asyncio
+    async def test_scan_batch_coalesces_saves(
+        self,
+        file_manager: FileManager,
+        scan_cache: ScanCache,
+        sample_tools: list[Tool],
+    ) -> None:
+        """Test that successful scans are buffered into a single save."""
+        scanner = TrivyScanner()
+        resolver = ImageResolver()
+        orchestrator = ScanOrchestrator(
+            scanner=scanner,
+            resolver=resolver,
+            scan_cache=scan_cache,
+            file_manager=file_manager,
+            staleness_days=7,
+            save_batch_size=10,
+        )
+
+        scan_result = ScanResult(
+            success=True,
+            vulnerabilities=Vulnerabilities(),
+            scan_date=datetime.now(UTC),
+            error=None,
+            scan_duration_seconds=3.0,
+            image_ref="postgres:stable",
+            scanned_tag="stable",
+        )
+
+        save_calls = []
+        original_save = file_manager.save_processed
+
+        def mock_save(tools, merge=True):
+            save_calls.append(tools)
+            return original_save(tools, merge=merge)
+
+        with patch.object(file_manager, "save_processed", side_effect=mock_save), \
+             patch.object(scanner, "scan_image", return_value=scan_result), \
+             patch.object(orchestrator, "_warmup_trivy_db", AsyncMock(return_value=True)):
+            result = await orchestrator.scan_batch(sample_tools, concurrency=1)
+
+        # Fewer successes than the batch size: one save with both tools at the end
+        assert result.succeeded == 2
+        assert len(save_calls) == 1
+        assert [t.id for t in save_calls[0]] == [t.id for t in sample_tools]
+
+        saved_tools = file_manager.load_processed()
+        assert saved_tools is not None
+        assert len(saved_tools) == 2
+
     @pytest.mark.asyncio
     async def test_scan_batch_failed_save_doesnt_break_scan(
         self,
@@ -268,7 +317,7 @@ class TestScanOrchestrator:
         scan_cache: ScanCache,
         sample_tools: list[Tool],
     ) -> None:
-        """Test that completed scans are saved before crash."""
+        """Test that completed scans are saved when another scan crashes."""
         scanner = TrivyScanner()
         resolver = ImageResolver()
         orchestrator = ScanOrchestrator(
@@ -295,18 +344,75 @@ class TestScanOrchestrator:
             raise Exception("Simulated crash")
 
         with patch.object(scanner, "scan_image", side_effect=mock_scan_image):
-            try:
-                await orchestrator.scan_batch(sample_tools, concurrency=1)
-            except Exception:
-                pass  # Expected to crash
+            result = await orchestrator.scan_batch(sample_tools, concurrency=1)
 
-            # First tool should have been saved before crash
+            # The crash is recorded as a failure instead of aborting the batch
+            assert result.succeeded == 1
+            assert result.failed == 1
+            assert "Simulated crash" in result.failures["docker_hub:library/redis"]
+
+            # First tool should have been saved despite the crash
             saved_tools = file_manager.load_processed()
             assert saved_tools is not None
             assert len(saved_tools) == 1
             assert saved_tools[0].id == "docker_hub:library/postgres"
             assert saved_tools[0].security.scanned_tag == "stable"
 
+    @pytest.mark.asyncio
+    async def test_scan_batch_resolver_crash_fails_only_that_tool(
+        self,
+        file_manager: FileManager,
+        scan_cache: ScanCache,
+        sample_tools: list[Tool],
+    ) -> None:
+        """Test that a resolver error before scanning doesn't abort the batch."""
+        scanner = TrivyScanner()
+        resolver = ImageResolver()
+        orchestrator = ScanOrchestrator(
+            scanner=scanner,
+            resolver=resolver,
+            scan_cache=scan_cache,
+            file_manager=file_manager,
+            staleness_days=7,
+        )
+
+        original_resolve = resolver.resolve_image_ref
+
+        def mock_resolve(tool):
+            if tool.name == "postgres":
+                raise RuntimeError("Simulated resolver crash")
+            return original_resolve(tool)
+
+        scan_result = ScanResult(
+            success=True,
+            vulnerabilities=Vulnerabilities(),
+            scan_date=datetime.now(UTC),
+            error=None,
+            scan_duration_seconds=3.0,
+            image_ref="redis:alpine",
+            scanned_tag="alpine",
+        )
+        progress: list[tuple[int, int]] = []
+
+        with (
+            patch.object(resolver, "resolve_image_ref", side_effect=mock_resolve),
+            patch.object(scanner, "scan_image", return_value=scan_result) as mock_scan,
+        ):
+            result = await orchestrator.scan_batch(
+                sample_tools,
+                concurrency=1,
+                progress_callback=lambda current, total: progress.append((current, total)),
+            )
+
+        assert result.succeeded == 1
+        assert result.failed == 1
+        assert "Simulated resolver crash" in result.failures["docker_hub:library/postgres"]
+        assert [tool.id for tool in result.updated_tools] == ["docker_hub:library/redis"]
+        # Only the warmup image and redis reach Trivy
+        scanned_refs = [call.args[0] for call in mock_scan.call_args_list]
+        assert not any("postgres" in ref for ref in scanned_refs)
+        assert progress == [(1, 2), (2, 2)]
+
     @pytest.mark.asyncio
     async def test_scan_one_handles_tuple_from_resolver(
         self,
@@ -343,6 +449,126 @@ class TestScanOrchestrator:
             # Verify the tag was used from resolve_image_ref
             assert result.updated_tools[0].security.scanned_tag == "stable"
 
+    @pytest.mark.asyncio
+    async def test_scan_batch_settles_unscannable_tools_before_scanning(
+        self,
+        file_manager: FileManager,
+        scan_cache: ScanCache,
+        sample_tools: list[Tool],
+    ) -> None:
+        """Test that cached failures and unresolvable tools never reach the scanner."""
+        scanner = TrivyScanner()
+        resolver = ImageResolver()
+        orchestrator = ScanOrchestrator(
+            scanner=scanner,
+            resolver=resolver,
+            scan_cache=scan_cache,
+            file_manager=file_manager,
+            staleness_days=7,
+        )
+        postgres, redis = sample_tools
+        scan_cache.mark_failed(postgres.id, "manifest unknown")
+        progress: list[tuple[int, int]] = []
+
+        with (
+            patch.object(orchestrator, "_warmup_trivy_db", AsyncMock(return_value=True)),
+            patch.object(resolver, "resolve_image_ref", return_value=None) as mock_resolve,
+            patch.object(scanner, "scan_image", new_callable=AsyncMock) as mock_scan,
+        ):
+            result = await orchestrator.scan_batch(
+                sample_tools,
+                concurrency=2,
+                progress_callback=lambda current, total: progress.append((current, total)),
+            )
+
+        mock_resolve.assert_called_once_with(redis)
+        mock_scan.assert_not_called()
+        assert result.skipped == 1
+        assert result.failed == 1
+        assert result.failures == {redis.id: "Could not resolve image reference"}
+        assert progress == [(1, 2), (2, 2)]
+
+    @pytest.mark.asyncio
+    async def test_scan_batch_first_scan_not_delayed_by_settled_tools(
+        self,
+        file_manager: FileManager,
+        scan_cache: ScanCache,
+        sample_tools: list[Tool],
+    ) -> None:
+        """Test that the between-scans delay ignores tools settled before scanning."""
+        scanner = TrivyScanner()
+        resolver = ImageResolver()
+        orchestrator = ScanOrchestrator(
+            scanner=scanner,
+            resolver=resolver,
+            scan_cache=scan_cache,
+            file_manager=file_manager,
+            staleness_days=7,
+        )
+        postgres, redis = sample_tools
+        scan_cache.mark_failed(postgres.id, "manifest unknown")
+        scan_result = ScanResult(
+            success=True,
+            vulnerabilities=Vulnerabilities(),
+            scan_date=datetime.now(UTC),
+            error=None,
+            scan_duration_seconds=3.0,
+            image_ref="redis:alpine",
+            scanned_tag="alpine",
+        )
+
+        with (
+            patch.object(orchestrator, "_warmup_trivy_db", AsyncMock(return_value=True)),
+            patch.object(scanner, "scan_image", return_value=scan_result) as mock_scan,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await orchestrator.scan_batch(sample_tools, concurrency=1)
+
+        mock_scan.assert_called_once()
+        mock_sleep.assert_not_called()
+        assert result.skipped == 1
+        assert [tool.id for tool in result.updated_tools] == [redis.id]
+
+    @pytest.mark.asyncio
+    async def test_scan_batch_keeps_input_order(
+        self,
+        file_manager: FileManager,
+        scan_cache: ScanCache,
+        sample_tools: list[Tool],
+    ) -> None:
+        """Test that updated_tools follows input order when scans finish out of order."""
+        scanner = TrivyScanner()
+        resolver = ImageResolver()
+        orchestrator = ScanOrchestrator(
+            scanner=scanner,
+            resolver=resolver,
+            scan_cache=scan_cache,
+            file_manager=file_manager,
+            staleness_days=7,
+        )
+
+        # The first tool's scan finishes last
+        async def mock_scan_image(image_ref: str) -> ScanResult:
+            if "postgres" in image_ref:
+                await asyncio.sleep(0.05)
+            return ScanResult(
+                success=True,
+                vulnerabilities=Vulnerabilities(),
+                scan_date=datetime.now(UTC),
+                error=None,
+                scan_duration_seconds=1.0,
+                image_ref=image_ref,
+                scanned_tag="latest",
+            )
+
+        with (
+            patch.object(orchestrator, "_warmup_trivy_db", AsyncMock(return_value=True)),
+            patch.object(scanner, "scan_image", side_effect=mock_scan_image),
+        ):
+            result = await orchestrator.scan_batch(sample_tools, concurrency=2)
+
+        assert [t.id for t in result.updated_tools] == [t.id for t in sample_tools]
+
     def test_filter_tools_needing_scan(
         self,
         file_manager: FileManager,
@@ -368,10 +594,13 @@ class TestScanOrchestrator:
         sample_tools[0].security.status = SecurityStatus.OK
         sample_tools[0].security.trivy_scan_date = datetime.now(UTC)
 
-        filtered = orchestrator.filter_tools_needing_scan(sample_tools)
+        with patch.object(scan_cache, "is_failed", wraps=scan_cache.is_failed) as mock_failed:
+            filtered = orchestrator.filter_tools_needing_scan(sample_tools)
         # Only the unscanned tool should be filtered
         assert len(filtered) == 1
         assert filtered[0].id == "docker_hub:library/redis"
+        # Up-to-date tools are settled without a failure-cache lookup
+        mock_failed.assert_called_once_with("docker_hub:library/redis")
 
     def test_filter_tools_with_force_flag(
         self,
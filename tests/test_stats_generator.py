@@ -1,9 +1,11 @@
 """Tests for statistics generator."""
 
 import math
-from datetime import datetime, timezone
+from collections.abc import Callable, Sequence
 
+import numpy as np
 import pytest
+from pydantic import ValidationError
 
 from src.evaluators.stats_generator import (
     _compute_distribution_stats,
@@ -11,14 +13,37 @@ from src.evaluators.stats_generator import (
     compute_global_stats,
     generate_all_stats,
 )
-from src.models.model_tool import (
-    Identity,
-    Maintainer,
-    MaintainerType,
-    Metrics,
-    SourceType,
-    Tool,
-)
+from src.models.model_tool import Metrics, Tool
+
+
+@pytest.fixture
+def make_tools(make_tool: Callable[..., Tool]) -> Callable[..., list[Tool]]:
+    """Factory for numbered tools with the given metrics and categories.
+
+    downloads, stars and (optionally) categories are per-tool sequences of
+    equal length; categories holds (primary_category, primary_subcategory).
+    """
+
+    def _make(
+        downloads: Sequence[int],
+        stars: Sequence[int],
+        categories: Sequence[tuple[str | None, str | None]] | None = None,
+    ) -> list[Tool]:
+        if categories is None:
+            categories = [(None, None)] * len(downloads)
+        return [
+            make_tool(
+                f"tool{i}",
+                metrics=Metrics(downloads=dl, stars=st),
+                primary_category=category,
+                primary_subcategory=subcategory,
+            )
+            for i, (dl, st, (category, subcategory)) in enumerate(
+                zip(downloads, stars, categories, strict=True)
+            )
+        ]
+
+    return _make
 
 
 def test_compute_distribution_stats():
@@ -41,26 +66,42 @@ def test_compute_distribution_stats():
     assert stats.log_std > 0
 
 
+def test_compute_distribution_stats_nearest_rank_percentiles():
+    """Test that percentiles are picked by index rather than interpolated."""
+    values = [80, 10, 70, 20, 60, 30, 50, 40]
+
+    stats = _compute_distribution_stats(values)
+
+    assert stats.median == 45.0  # Mean of the two middle values
+    assert stats.p25 == 30.0  # sorted[n // 4]
+    assert stats.p75 == 70.0  # sorted[3n // 4]
+    assert isinstance(stats.min, int)
+    assert isinstance(stats.max, int)
+
+
+def test_compute_distribution_stats_precomputed_logs():
+    """Test that caller-supplied log values match the internal log transform."""
+    values = [0, 5, 50, 500, 5000, 50000]
+    log_values = np.log1p(np.array(values[::-1]))  # Order doesn't matter
+
+    stats = _compute_distribution_stats(values, log_values=log_values)
+
+    assert stats.model_dump() == pytest.approx(_compute_distribution_stats(values).model_dump())
+
+
 def test_compute_distribution_stats_empty():
     """Test that empty values list raises error."""
     with pytest.raises(ValueError, match="Cannot compute stats from empty values list"):
         _compute_distribution_stats([])
 
 
-def test_compute_global_stats(sample_tool):
+def test_compute_global_stats(make_tools):
     """Test global statistics computation."""
     # Create sample tools with varying metrics
-    tools = [
-        Tool(
-            id=f"test:{i}/tool",
-            name=f"tool{i}",
-            source=SourceType.DOCKER_HUB,
-            source_url=f"https://example.com/{i}",
-            metrics=Metrics(downloads=1000 * (i + 1), stars=100 * (i + 1)),
-            scraped_at=datetime.now(timezone.utc),
-        )
-        for i in range(10)
-    ]
+    tools = make_tools(
+        downloads=[1000 * (i + 1) for i in range(10)],
+        stars=[100 * (i + 1) for i in range(10)],
+    )
 
     global_stats = compute_global_stats(tools)
 
@@ -86,34 +127,25 @@ def test_compute_global_stats_empty():
     assert global_stats.stars.log_std == 1.0
 
 
-def test_compute_category_stats():
+def test_compute_global_stats_empty_shares_frozen_sentinel():
+    """Test that sentinel stats reuse one immutable distribution."""
+    first = compute_global_stats([])
+    second = compute_global_stats([])
+    assert first.downloads is second.downloads
+    assert first.downloads is first.stars
+    with pytest.raises(ValidationError):
+        first.downloads.log_std = 0.0
+
+
+def test_compute_category_stats(make_tools):
     """Test category-level statistics computation."""
-    # Create tools in multiple categories
-    tools = []
-    for i in range(15):
-        # First 10 in databases/relational
-        if i < 10:
-            category = "databases"
-            subcategory = "relational"
-            downloads = 10000 * (i + 1)
-        # Next 5 in databases/cache
-        else:
-            category = "databases"
-            subcategory = "cache"
-            downloads = 5000 * (i + 1)
-
-        tools.append(
-            Tool(
-                id=f"test:{i}/tool",
-                name=f"tool{i}",
-                source=SourceType.DOCKER_HUB,
-                source_url=f"https://example.com/{i}",
-                metrics=Metrics(downloads=downloads, stars=100 * (i + 1)),
-                primary_category=category,
-                primary_subcategory=subcategory,
-                scraped_at=datetime.now(timezone.utc),
-            )
-        )
+    # First 10 in databases/relational, next 5 in databases/cache
+    download_steps = [10000] * 10 + [5000] * 5
+    tools = make_tools(
+        downloads=[step * (i + 1) for i, step in enumerate(download_steps)],
+        stars=[100 * (i + 1) for i in range(15)],
+        categories=[("databases", "relational")] * 10 + [("databases", "cache")] * 5,
+    )
 
     category_stats = compute_category_stats(tools)
 
@@ -131,30 +163,13 @@ def test_compute_category_stats():
     assert category_stats["databases/relational"].downloads.max == 100000
 
 
-def test_compute_category_stats_skip_uncategorized():
+def test_compute_category_stats_skip_uncategorized(make_tools):
     """Test that tools without categorization are skipped."""
-    tools = [
-        Tool(
-            id="test:1/categorized",
-            name="categorized",
-            source=SourceType.DOCKER_HUB,
-            source_url="https://example.com/1",
-            metrics=Metrics(downloads=10000, stars=100),
-            primary_category="databases",
-            primary_subcategory="relational",
-            scraped_at=datetime.now(timezone.utc),
-        ),
-        Tool(
-            id="test:2/uncategorized",
-            name="uncategorized",
-            source=SourceType.DOCKER_HUB,
-            source_url="https://example.com/2",
-            metrics=Metrics(downloads=20000, stars=200),
-            primary_category=None,  # No category
-            primary_subcategory=None,
-            scraped_at=datetime.now(timezone.utc),
-        ),
-    ]
+    tools = make_tools(
+        downloads=[10000, 20000],
+        stars=[100, 200],
+        categories=[("databases", "relational"), (None, None)],  # Second has no category
+    )
 
     category_stats = compute_category_stats(tools)
 
@@ -172,25 +187,17 @@ def test_compute_category_stats_empty():
     assert category_stats == {}
 
 
-def test_generate_all_stats():
+def test_generate_all_stats(make_tools):
     """Test generating both global and category stats."""
-    tools = []
-    for i in range(20):
-        category = "databases" if i < 15 else "monitoring"
-        subcategory = "relational" if i < 10 else ("cache" if i < 15 else "metrics")
-
-        tools.append(
-            Tool(
-                id=f"test:{i}/tool",
-                name=f"tool{i}",
-                source=SourceType.DOCKER_HUB,
-                source_url=f"https://example.com/{i}",
-                metrics=Metrics(downloads=1000 * (i + 1), stars=100 * (i + 1)),
-                primary_category=category,
-                primary_subcategory=subcategory,
-                scraped_at=datetime.now(timezone.utc),
-            )
-        )
+    tools = make_tools(
+        downloads=[1000 * (i + 1) for i in range(20)],
+        stars=[100 * (i + 1) for i in range(20)],
+        categories=(
+            [("databases", "relational")] * 10
+            + [("databases", "cache")] * 5
+            + [("monitoring", "metrics")] * 5
+        ),
+    )
 
     global_stats, category_stats = generate_all_stats(tools)
 
@@ -204,21 +211,21 @@ def test_generate_all_stats():
     assert category_stats["monitoring/metrics"].sample_size == 5
 
 
-def test_small_category_handling():
+def test_generate_all_stats_empty():
+    """Test that an empty catalog yields sentinel global stats and no categories."""
+    global_stats, category_stats = generate_all_stats([])
+    assert global_stats.total_tools == 0
+    assert global_stats.downloads.log_std == 1.0
+    assert category_stats == {}
+
+
+def test_small_category_handling(make_tools):
     """Test that small categories still compute stats."""
-    tools = [
-        Tool(
-            id=f"test:{i}/tool",
-            name=f"tool{i}",
-            source=SourceType.DOCKER_HUB,
-            source_url=f"https://example.com/{i}",
-            metrics=Metrics(downloads=1000 * (i + 1), stars=100),
-            primary_category="small",
-            primary_subcategory="category",
-            scraped_at=datetime.now(timezone.utc),
-        )
-        for i in range(3)  # Only 3 tools
-    ]
+    tools = make_tools(  # Only 3 tools
+        downloads=[1000, 2000, 3000],
+        stars=[100] * 3,
+        categories=[("small", "category")] * 3,
+    )
 
     category_stats = compute_category_stats(tools)
 
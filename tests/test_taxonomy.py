@@ -1,5 +1,7 @@
 """Tests for the taxonomy module."""
 
+import pytest
+
 from src.categorization.human_maintained import TAXONOMY
 from src.categorization.taxonomy import (
     get_all_categories,
@@ -111,6 +113,17 @@ class TestGetCategory:
         assert isinstance(categories, list)
         assert len(categories) == len(TAXONOMY)
 
+    def test_get_all_categories_returns_fresh_list(self) -> None:
+        categories = get_all_categories()
+        categories.clear()
+        assert get_all_categories() == [cat.name for cat in TAXONOMY]
+
+    def test_get_category_matches_taxonomy(self) -> None:
+        for cat in TAXONOMY:
+            assert get_category(cat.name) is cat
+            for sub in cat.subcategories:
+                assert is_valid_subcategory(cat.name, sub.name) is True
+
 
 class TestGetAllSubcategories:
     """Tests for get_all_subcategories function."""
@@ -214,6 +227,16 @@ class TestValidateClassification:
         assert is_valid is False
         assert "Invalid secondary category" in error
 
+    def test_invalid_secondary_extra_segment(self) -> None:
+        # Only the first "/" separates category from subcategory
+        is_valid, error = validate_classification(
+            "databases",
+            "relational",
+            ["monitoring/metrics/extra"],
+        )
+        assert is_valid is False
+        assert "Invalid secondary category" in error
+
     def test_empty_secondary_categories(self) -> None:
         is_valid, error = validate_classification("databases", "relational", [])
         assert is_valid is True
@@ -222,43 +245,22 @@ class TestValidateClassification:
 class TestKeywordCoverage:
     """Tests to ensure keywords match expected tools."""
 
-    def test_postgres_keywords(self) -> None:
-        db = get_category("databases")
-        assert db is not None
-        relational = db.get_subcategory("relational")
-        assert relational is not None
-        assert "postgres" in relational.keywords
-        assert "postgresql" in relational.keywords
-        assert "mysql" in relational.keywords
-
-    def test_redis_keywords(self) -> None:
-        db = get_category("databases")
-        assert db is not None
-        kv = db.get_subcategory("key-value")
-        assert kv is not None
-        assert "redis" in kv.keywords
-        assert "memcached" in kv.keywords
-
-    def test_grafana_keywords(self) -> None:
-        mon = get_category("monitoring")
-        assert mon is not None
-        viz = mon.get_subcategory("visualization")
-        assert viz is not None
-        assert "grafana" in viz.keywords
-        assert "kibana" in viz.keywords
-
-    def test_nginx_keywords(self) -> None:
-        web = get_category("web")
-        assert web is not None
-        server = web.get_subcategory("server")
-        assert server is not None
-        assert "nginx" in server.keywords
-        assert "apache" in server.keywords
-
-    def test_kafka_keywords(self) -> None:
-        msg = get_category("messaging")
-        assert msg is not None
-        streaming = msg.get_subcategory("streaming")
-        assert streaming is not None
-        assert "kafka" in streaming.keywords
-        assert "redpanda" in streaming.keywords
+    @pytest.mark.parametrize(
+        ("category_name", "subcategory_name", "expected_keywords"),
+        [
+            ("databases", "relational", ["postgres", "postgresql", "mysql"]),
+            ("databases", "key-value", ["redis", "memcached"]),
+            ("monitoring", "visualization", ["grafana", "kibana"]),
+            ("web", "server", ["nginx", "apache"]),
+            ("messaging", "streaming", ["kafka", "redpanda"]),
+        ],
+    )
+    def test_subcategory_keywords(
+        self, category_name: str, subcategory_name: str, expected_keywords: list[str]
+    ) -> None:
+        category = get_category(category_name)
+        assert category is not None
+        subcategory = category.get_subcategory(subcategory_name)
+        assert subcategory is not None
+        # Set difference so a failure names the missing keywords
+        assert set(expected_keywords) - set(subcategory.keywords) == set()
@@ -2,7 +2,7 @@
 
 import asyncio
 import json
-from datetime import UTC, datetime
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,6 +12,25 @@ from src.models.model_tool import Vulnerabilities
 from src.scanner.trivy_scanner import TrivyScanner
 
 
+def successful_scan_remote(now: datetime):
+    """Build a _scan_remote stand-in that succeeds without setting tag/digest.
+
+    scan_image() is expected to fill those in from the image reference.
+    """
+
+    async def mock_scan_remote(image_ref):
+        return ScanResult(
+            success=True,
+            vulnerabilities=Vulnerabilities(critical=2, high=3, medium=2, low=1),
+            scan_date=now,
+            error=None,
+            scan_duration_seconds=5.0,
+            image_ref=image_ref,
+        )
+
+    return mock_scan_remote
+
+
 class TestTrivyScanner:
     """Tests for TrivyScanner class."""
 
@@ -37,6 +56,17 @@ class TestTrivyScanner:
             }
         )
 
+    @pytest.fixture
+    def patched_scanner(self, monkeypatch: pytest.MonkeyPatch) -> TrivyScanner:
+        """TrivyScanner whose remote and local scans are AsyncMocks.
+
+        Tests set return_value or side_effect on _scan_remote/_scan_local.
+        """
+        scanner = TrivyScanner()
+        monkeypatch.setattr(scanner, "_scan_remote", AsyncMock())
+        monkeypatch.setattr(scanner, "_scan_local", AsyncMock())
+        return scanner
+
     def test_parse_trivy_output(self, mock_trivy_output: str) -> None:
         """Test parsing Trivy JSON output."""
         scanner = TrivyScanner()
@@ -58,6 +88,31 @@ class TestTrivyScanner:
         assert vulnerabilities.medium == 0
         assert vulnerabilities.low == 0
 
+    def test_parse_trivy_output_null_vulnerabilities(self) -> None:
+        """Test that targets with null vulnerability lists don't drop other counts."""
+        scanner = TrivyScanner()
+        output = json.dumps(
+            {
+                "Results": [
+                    {"Target": "os-pkgs", "Vulnerabilities": None},
+                    {
+                        "Target": "lang-pkgs",
+                        "Vulnerabilities": [
+                            {"Severity": "CRITICAL"},
+                            {"Severity": "LOW"},
+                            {"Severity": "UNKNOWN"},
+                        ],
+                    },
+                ]
+            }
+        )
+        vulnerabilities = scanner._parse_trivy_output(output)
+
+        assert vulnerabilities.critical == 1
+        assert vulnerabilities.high == 0
+        assert vulnerabilities.medium == 0
+        assert vulnerabilities.low == 1
+
     def test_parse_trivy_output_invalid_json(self) -> None:
         """Test parsing invalid JSON returns empty vulnerabilities."""
         scanner = TrivyScanner()
@@ -69,221 +124,151 @@ class TestTrivyScanner:
         assert vulnerabilities.low == 0
 
     @pytest.mark.asyncio
-    async def test_scan_image_extracts_tag_from_image_ref(self, mock_trivy_output: str) -> None:
-        """Test that scan_image extracts tag from image reference."""
-        scanner = TrivyScanner()
-
-        # Mock the _scan_remote method to return success (without scanned_tag)
-        # scan_image() will extract and set the tag
-        async def mock_scan_remote(image_ref):
-            return ScanResult(
-                success=True,
-                vulnerabilities=Vulnerabilities(critical=2, high=3, medium=2, low=1),
-                scan_date=datetime.now(UTC),
-                error=None,
-                scan_duration_seconds=5.0,
-                image_ref=image_ref,
-            )
-
-        with patch.object(scanner, "_scan_remote", side_effect=mock_scan_remote):
-            result = await scanner.scan_image("postgres:stable")
-
-            assert result.success is True
-            assert result.scanned_tag == "stable"
-            assert result.image_ref == "postgres:stable"
-
-    @pytest.mark.asyncio
-    async def test_scan_image_extracts_tag_alpine(self, mock_trivy_output: str) -> None:
-        """Test tag extraction for alpine variant."""
-        scanner = TrivyScanner()
-
-        async def mock_scan_remote(image_ref):
-            return ScanResult(
-                success=True,
-                vulnerabilities=Vulnerabilities(),
-                scan_date=datetime.now(UTC),
-                error=None,
-                scan_duration_seconds=3.0,
-                image_ref=image_ref,
-            )
-
-        with patch.object(scanner, "_scan_remote", side_effect=mock_scan_remote):
-            result = await scanner.scan_image("redis:alpine")
-
-            assert result.scanned_tag == "alpine"
+    @pytest.mark.parametrize(
+        ("image_ref", "expected_tag"),
+        [
+            ("postgres:stable", "stable"),
+            ("redis:alpine", "alpine"),
+            ("bitnami/postgresql:15.2.0", "15.2.0"),
+        ],
+    )
+    async def test_scan_image_extracts_tag(
+        self, patched_scanner: TrivyScanner, image_ref: str, expected_tag: str, now: datetime
+    ) -> None:
+        """Test that scan_image extracts the tag from the image reference."""
+        patched_scanner._scan_remote.side_effect = successful_scan_remote(now)
+
+        result = await patched_scanner.scan_image(image_ref)
+
+        assert result.success is True
+        assert result.scanned_tag == expected_tag
+        assert result.image_ref == image_ref
 
     @pytest.mark.asyncio
-    async def test_scan_image_extracts_tag_versioned(self) -> None:
-        """Test tag extraction for versioned tag."""
-        scanner = TrivyScanner()
-
-        async def mock_scan_remote(image_ref):
-            return ScanResult(
-                success=True,
-                vulnerabilities=Vulnerabilities(),
-                scan_date=datetime.now(UTC),
-                error=None,
-                scan_duration_seconds=4.0,
-                image_ref=image_ref,
-            )
-
-        with patch.object(scanner, "_scan_remote", side_effect=mock_scan_remote):
-            result = await scanner.scan_image("bitnami/postgresql:15.2.0")
-
-            assert result.scanned_tag == "15.2.0"
-
-    @pytest.mark.asyncio
-    async def test_scan_image_no_tag_in_ref(self) -> None:
+    async def test_scan_image_no_tag_in_ref(
+        self, patched_scanner: TrivyScanner, now: datetime
+    ) -> None:
         """Test handling of image reference without tag."""
-        scanner = TrivyScanner()
-
-        mock_result = ScanResult(
+        patched_scanner._scan_remote.return_value = ScanResult(
             success=True,
             vulnerabilities=Vulnerabilities(),
-            scan_date=datetime.now(UTC),
+            scan_date=now,
             error=None,
             scan_duration_seconds=2.0,
             image_ref="nginx",
         )
 
-        with patch.object(scanner, "_scan_remote", return_value=mock_result):
-            result = await scanner.scan_image("nginx")
+        result = await patched_scanner.scan_image("nginx")
 
-            # Should be None if no colon in image_ref
-            assert result.scanned_tag is None
+        # Should be None if no colon in image_ref
+        assert result.scanned_tag is None
 
     @pytest.mark.asyncio
-    async def test_scan_image_fallback_to_local_preserves_tag(self, mock_trivy_output: str) -> None:
+    async def test_scan_image_fallback_to_local_preserves_tag(
+        self, patched_scanner: TrivyScanner, now: datetime
+    ) -> None:
         """Test that tag is preserved when falling back to local scan."""
-        scanner = TrivyScanner()
-
         # Mock remote scan to fail
-        mock_remote_fail = ScanResult(
+        patched_scanner._scan_remote.return_value = ScanResult(
             success=False,
             vulnerabilities=None,
-            scan_date=datetime.now(UTC),
+            scan_date=now,
             error="Remote scan failed",
             scan_duration_seconds=1.0,
             image_ref="postgres:stable",
         )
 
         # Mock local scan to succeed
-        mock_local_success = ScanResult(
+        patched_scanner._scan_local.return_value = ScanResult(
             success=True,
             vulnerabilities=Vulnerabilities(critical=1, high=2, medium=3, low=4),
-            scan_date=datetime.now(UTC),
+            scan_date=now,
             error=None,
             scan_duration_seconds=10.0,
             image_ref="postgres:stable",
         )
 
-        with patch.object(scanner, "_scan_remote", return_value=mock_remote_fail), \
-             patch.object(scanner, "_scan_local", return_value=mock_local_success):
-            result = await scanner.scan_image("postgres:stable")
+        result = await patched_scanner.scan_image("postgres:stable")
 
-            assert result.success is True
-            assert result.scanned_tag == "stable"
-            assert result.image_ref == "postgres:stable"
+        assert result.success is True
+        assert result.scanned_tag == "stable"
+        assert result.image_ref == "postgres:stable"
 
     @pytest.mark.asyncio
-    async def test_scan_image_error_preserves_tag(self) -> None:
+    async def test_scan_image_error_preserves_tag(
+        self, patched_scanner: TrivyScanner, now: datetime
+    ) -> None:
         """Test that tag is preserved even when scan fails."""
-        scanner = TrivyScanner()
-
         mock_fail = ScanResult(
             success=False,
             vulnerabilities=None,
-            scan_date=datetime.now(UTC),
+            scan_date=now,
             error="Scan failed",
             scan_duration_seconds=1.0,
             image_ref="nonexistent:edge",
         )
 
-        with patch.object(scanner, "_scan_remote", return_value=mock_fail), \
-             patch.object(scanner, "_scan_local", return_value=mock_fail):
-            result = await scanner.scan_image("nonexistent:edge")
-
-            assert result.success is False
-            assert result.scanned_tag == "edge"
-            assert result.error == "Scan failed"
-
-    @pytest.mark.asyncio
-    async def test_scan_image_extracts_digest_from_image_ref(self) -> None:
-        """Test that scan_image extracts digest from digest reference."""
-        scanner = TrivyScanner()
-
-        async def mock_scan_remote(image_ref):
-            return ScanResult(
-                success=True,
-                vulnerabilities=Vulnerabilities(critical=1, high=2, medium=1, low=0),
-                scan_date=datetime.now(UTC),
-                error=None,
-                scan_duration_seconds=5.0,
-                image_ref=image_ref,
-            )
+        patched_scanner._scan_remote.return_value = mock_fail
+        patched_scanner._scan_local.return_value = mock_fail
 
-        with patch.object(scanner, "_scan_remote", side_effect=mock_scan_remote):
-            result = await scanner.scan_image("postgres@sha256:abc123def456")
+        result = await patched_scanner.scan_image("nonexistent:edge")
 
-            assert result.success is True
-            assert result.scanned_digest == "sha256:abc123def456"
-            assert result.scanned_tag is None  # No tag when using digest
-            assert result.image_ref == "postgres@sha256:abc123def456"
+        assert result.success is False
+        assert result.scanned_tag == "edge"
+        assert result.error == "Scan failed"
 
     @pytest.mark.asyncio
-    async def test_scan_image_digest_with_namespace(self) -> None:
-        """Test digest extraction for image with namespace."""
-        scanner = TrivyScanner()
-
-        async def mock_scan_remote(image_ref):
-            return ScanResult(
-                success=True,
-                vulnerabilities=Vulnerabilities(),
-                scan_date=datetime.now(UTC),
-                error=None,
-                scan_duration_seconds=3.0,
-                image_ref=image_ref,
-            )
-
-        with patch.object(scanner, "_scan_remote", side_effect=mock_scan_remote):
-            result = await scanner.scan_image("bitnami/postgresql@sha256:xyz789uvw321")
-
-            assert result.scanned_digest == "sha256:xyz789uvw321"
-            assert result.scanned_tag is None
+    @pytest.mark.parametrize(
+        ("image_ref", "expected_digest"),
+        [
+            ("postgres@sha256:abc123def456", "sha256:abc123def456"),
+            ("bitnami/postgresql@sha256:xyz789uvw321", "sha256:xyz789uvw321"),
+        ],
+    )
+    async def test_scan_image_extracts_digest(
+        self, patched_scanner: TrivyScanner, image_ref: str, expected_digest: str, now: datetime
+    ) -> None:
+        """Test that scan_image extracts the digest from a digest reference."""
+        patched_scanner._scan_remote.side_effect = successful_scan_remote(now)
+
+        result = await patched_scanner.scan_image(image_ref)
+
+        assert result.success is True
+        assert result.scanned_digest == expected_digest
+        assert result.scanned_tag is None  # No tag when using digest
+        assert result.image_ref == image_ref
 
     @pytest.mark.asyncio
-    async def test_scan_image_fallback_to_local_preserves_digest(self) -> None:
+    async def test_scan_image_fallback_to_local_preserves_digest(
+        self, patched_scanner: TrivyScanner, now: datetime
+    ) -> None:
         """Test that digest is preserved when falling back to local scan."""
-        scanner = TrivyScanner()
-
         # Mock remote scan to fail
-        mock_remote_fail = ScanResult(
+        patched_scanner._scan_remote.return_value = ScanResult(
             success=False,
             vulnerabilities=None,
-            scan_date=datetime.now(UTC),
+            scan_date=now,
             error="Remote scan failed",
             scan_duration_seconds=1.0,
             image_ref="postgres@sha256:test123",
         )
 
         # Mock local scan to succeed
-        mock_local_success = ScanResult(
+        patched_scanner._scan_local.return_value = ScanResult(
             success=True,
             vulnerabilities=Vulnerabilities(critical=0, high=1, medium=2, low=3),
-            scan_date=datetime.now(UTC),
+            scan_date=now,
             error=None,
             scan_duration_seconds=10.0,
             image_ref="postgres@sha256:test123",
         )
 
-        with patch.object(scanner, "_scan_remote", return_value=mock_remote_fail), \
-             patch.object(scanner, "_scan_local", return_value=mock_local_success):
-            result = await scanner.scan_image("postgres@sha256:test123")
+        result = await patched_scanner.scan_image("postgres@sha256:test123")
 
-            assert result.success is True
-            assert result.scanned_digest == "sha256:test123"
-            assert result.scanned_tag is None
-            assert result.image_ref == "postgres@sha256:test123"
+        assert result.success is True
+        assert result.scanned_digest == "sha256:test123"
+        assert result.scanned_tag is None
+        assert result.image_ref == "postgres@sha256:test123"
 
     def test_is_trivy_installed(self) -> None:
         """Test Trivy installation check."""